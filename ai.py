@@ -26,16 +26,28 @@ from constants import *
 from enum import Enum
 import numpy as np
 import random
+import time
 from board_functions import reveal
+from topology import get_topology
+from solver import FrontierSolver
+from journal import GameJournal
+import telemetry
 
 class AIEngine:
-    def __init__(self, difficulty: AIDifficulty):
+    def __init__(self, difficulty: AIDifficulty, topology=None, patterns=None):
         """
         AIEngine class to store methods and attributes 
         Args:
-            difficulty (AIDifficulty): difficulty mode of ai, either AIDifficulty.Easy, AIDifficulty.Medium, or AIDifficulty.Hard
+            difficulty (AIDifficulty): difficulty mode of ai, either AIDifficulty.Easy, AIDifficulty.Medium, AIDifficulty.Hard or AIDifficulty.Expert
+            topology (Topology): neighbour tables of the board, None to use a bounded board of board.shape
+            patterns (PatternCache): cache of local frontier deductions tried before the solver (Expert), None to skip
         """
         self.difficulty: AIDifficulty = difficulty
+        self.topology = topology
+        # constraint rows persist between Expert moves and are updated incrementally
+        self.solver = FrontierSolver(topology)
+        self.patterns = patterns
+        self._hypotheses = None  # flag array the lookahead pushes assumed mines onto
     
     def set_difficulty(self, difficulty: AIDifficulty):
         self.difficulty = difficulty
@@ -51,6 +63,35 @@ class AIEngine:
             revealed (np.ndarray): An array of bools that represents squares on the board that have been revealed.
                                     Their implementation is a square is True if revealed or False if not.
         """
+        start = time.perf_counter()
+        move = self._choose_move(board, revealed)
+        # decision latency in milliseconds
+        telemetry.emit(telemetry.AI_MOVE, move[0], move[1], (time.perf_counter() - start) * 1000)
+        return move
+
+    def next_move(self, board: np.ndarray, revealed: np.ndarray, flagged: np.ndarray):
+        """
+        The AI's whole turn: a chord when make_chord finds one, otherwise a cell to reveal.
+        Both attempts are timed together and emitted as one ai_move telemetry record.
+        Args:
+            board (np.ndarray): The minesweeper board
+            revealed (np.ndarray): Revealed state array
+            flagged (np.ndarray): Flagged state array
+        Returns:
+            tuple: (x, y, mines); for a chord, the number to chord on and the deduced mines to
+                   flag first, for a reveal, the cell and None
+        """
+        start = time.perf_counter()
+        chord = self.make_chord(board, revealed, flagged)
+        if chord is None:
+            x, y = self._choose_move(board, revealed)
+            mines = None
+        else:
+            x, y, mines = chord
+        telemetry.emit(telemetry.AI_MOVE, x, y, (time.perf_counter() - start) * 1000)
+        return x, y, mines
+
+    def _choose_move(self, board: np.ndarray, revealed: np.ndarray):
         match self.difficulty:
             case AIDifficulty.Easy:
                 return self._make_easy_move(board, revealed)
@@ -61,6 +102,98 @@ class AIEngine:
             case AIDifficulty.Hard:
                 return self._make_hard_move(board, revealed)
 
+            case AIDifficulty.Expert:
+                return self._make_expert_move(board, revealed)
+
+    def make_chord(self, board: np.ndarray, revealed: np.ndarray, flagged: np.ndarray):
+        """
+        Find a chord: a revealed number whose known mines already match its count, so all of
+        its other hidden neighbours can be revealed in one move. Known mines are only those
+        forced by numbers whose hidden neighbours must all be mines; player flags are not
+        trusted, so a chord never uncovers a mine. Numbers next to a flag the AI did not
+        deduce are skipped, since the flag count would not match.
+        Args:
+            board (np.ndarray): The minesweeper board
+            revealed (np.ndarray): Revealed state array
+            flagged (np.ndarray): Flagged state array
+        Returns:
+            tuple: (x, y, mines) with the flat indices of deduced mines to flag before chording,
+                   or None if there is no chord (or the difficulty does not use chords)
+        """
+        if self.difficulty == AIDifficulty.Easy:
+            return None
+        topology = self.topology or get_topology(board.shape)
+        flat_board = board.reshape(-1)
+        flat_revealed = revealed.reshape(-1)
+        hidden = ~flat_revealed
+        numbered = flat_revealed & (flat_board > 0)
+
+        # a number with exactly as many hidden neighbours as its count is surrounded by mines
+        forced = numbered & (topology.neighbor_sum(hidden) == flat_board)
+        mines = hidden & (topology.neighbor_sum(forced) > 0)
+        known_mines = topology.neighbor_sum(mines)
+        clearable = topology.neighbor_sum(hidden & ~mines)
+        stray_flags = topology.neighbor_sum(flagged.reshape(-1) & ~mines)
+        chords = np.flatnonzero(numbered & (known_mines == flat_board) & (clearable > 0) & (stray_flags == 0))
+        if chords.size == 0:
+            return None
+        cell = int(chords[0])
+        neighbors = topology.indices[topology.indptr[cell]:topology.indptr[cell + 1]]
+        x, y = divmod(cell, topology.cols)
+        return x, y, neighbors[mines[neighbors] & ~flagged.reshape(-1)[neighbors]]
+
+    def lookahead(self, board: np.ndarray, revealed: np.ndarray, cells, limit=None):
+        """
+        Prove cells safe by contradiction: assume a cell is a mine, follow the mines and
+        safe cells that forces on the revealed numbers, and see whether some number ends up
+        with too many or too few mines. Assumptions are pushed on and popped off a journal
+        over the AI's own flag array, so player flags are not trusted and nothing is copied.
+        Only revealed numbers are read, never the hidden cells.
+        Args:
+            board (np.ndarray): The minesweeper board
+            revealed (np.ndarray): Revealed state array
+            cells: Flat indices of hidden cells to test
+            limit (int): Stop after proving this many cells safe, None to test them all
+        Returns:
+            list: The cells that cannot be mines
+        """
+        topology = self.topology or get_topology(board.shape)
+        if self._hypotheses is None or self._hypotheses.shape != board.shape:
+            self._hypotheses = np.zeros(board.shape, dtype=bool)
+        journal = GameJournal(board, revealed, self._hypotheses, topology)
+        flat_revealed = revealed.reshape(-1)
+        counts = np.where(flat_revealed, board.reshape(-1), 0)
+        numbered = flat_revealed & (counts >= 0)
+        hidden = ~flat_revealed
+        assumed = self._hypotheses.reshape(-1)  # view, follows push/pop
+
+        safe = []
+        for cell in cells:
+            journal.push(*divmod(int(cell), topology.cols))
+            pushed = 1
+            while True:
+                need = counts - topology.neighbor_sum(assumed)
+                # numbers that already have all their mines clear their other neighbours
+                cleared = topology.neighbor_sum(numbered & (need == 0)) > 0
+                open_cells = hidden & ~assumed & ~cleared
+                room = topology.neighbor_sum(open_cells)
+                if np.any(numbered & ((need < 0) | (need > room))):
+                    safe.append(int(cell))
+                    break
+                # numbers with exactly as many open neighbours as missing mines force them all
+                full = numbered & (need > 0) & (need == room)
+                forced = np.flatnonzero(open_cells & (topology.neighbor_sum(full) > 0))
+                if forced.size == 0:
+                    break
+                for f in forced:
+                    journal.push(*divmod(int(f), topology.cols))
+                pushed += forced.size
+            for _ in range(pushed):
+                journal.pop()
+            if len(safe) == limit:
+                break
+        return safe
+
     def _make_easy_move(self, board: np.ndarray, revealed: np.ndarray):
         # get indices where revealed==false, those are squares ai can choose
         unrevealed_indices = np.where(revealed == False)
@@ -77,7 +210,7 @@ class AIEngine:
 
 
     def _make_medium_move(self, board: np.ndarray, revealed: np.ndarray):
-        safe_move = self._find_safe_move(board, revealed)
+        safe_move = self._find_safe_move(board, revealed, lookahead=True)
         if safe_move:
             return safe_move
 
@@ -86,42 +219,59 @@ class AIEngine:
         x, y = random.choice(unrevealed_coords)
         return x, y
 
-    def _find_safe_move(self, board: np.ndarray, revealed: np.ndarray):
-        size = board.shape[0]
-
-        low_probability = float('inf')
-        low_probability_indicie = None
-
-        for x in range(size):
-            for y in range(size):
-                if revealed[x, y]:
-                    continue
-
-                max_probability = 0
+    def _find_safe_move(self, board: np.ndarray, revealed: np.ndarray, exclude=None, lookahead=False):
+        topology = self.topology or get_topology(board.shape)
+        flat_board = board.reshape(-1)
+        flat_revealed = revealed.reshape(-1)
 
-                for i in range(max(0, x - 1), min(size, x + 2)):
-                    for j in range(max(0, y - 1), min(size, y + 2)):
-                        if not revealed[i, j] or board[i, j] <= 0:
-                            continue
+        # number of unrevealed neighbours of every cell, in one gather
+        unrevealed_count = topology.neighbor_sum(~flat_revealed)
+        # mine probability each revealed number spreads over its unrevealed neighbours
+        numbered = flat_revealed & (flat_board > 0) & (unrevealed_count > 0)
+        probability = np.zeros(topology.size)
+        probability[numbered] = flat_board[numbered] / unrevealed_count[numbered]
+        # a cell's risk is the highest probability of any revealed number next to it
+        max_probability = topology.neighbor_max(probability)
 
-                        unrevealed_count = 0
-                        for ii in range(max(0, i - 1), min(size, i + 2)):
-                            for jj in range(max(0, j - 1), min(size, j + 2)):
-                                if not revealed[ii, jj]:
-                                    unrevealed_count += 1
+        candidates = ~flat_revealed
+        if exclude is not None:
+            candidates &= ~exclude
+        safe = np.flatnonzero(candidates & (max_probability == 0))
+        if safe.size:
+            return divmod(int(safe[0]), topology.cols)
 
-                        if unrevealed_count > 0:
-                            probability = board[i, j] / unrevealed_count
-                            max_probability = max(max_probability, probability)
+        risky = np.flatnonzero(candidates & (max_probability > 0))
+        if risky.size == 0:
+            return None
+        if lookahead:
+            # before guessing, try to prove a frontier cell safe
+            proven = self.lookahead(board, revealed, risky, limit=1)
+            if proven:
+                return divmod(proven[0], topology.cols)
+        # argmin keeps the first cell in row-major order on ties
+        low_probability_indicie = risky[np.argmin(max_probability[risky])]
+        return divmod(int(low_probability_indicie), topology.cols)
 
-                if max_probability == 0:
-                    return (x, y)
+    def _make_expert_move(self, board: np.ndarray, revealed: np.ndarray):
+        # common local patterns are answered from the cache without solving
+        if self.patterns is not None:
+            cell = next(self.patterns.safe_cells(board, revealed, self.topology), None)
+            if cell is not None:
+                return divmod(cell, board.shape[1])
 
-                if max_probability > 0 and max_probability < low_probability:
-                    low_probability = max_probability
-                    low_probability_indicie = (x, y)
+        # exact deduction from the frontier constraints
+        self.solver.update(board, revealed)
+        safe, mines = self.solver.solve()
+        if safe:
+            return divmod(safe[0], board.shape[1])
 
-        return low_probability_indicie
+        # no certain cell: fall back to the probability estimate, never on a proven mine
+        exclude = np.zeros(board.size, dtype=bool)
+        exclude[mines] = True
+        guess = self._find_safe_move(board, revealed, exclude)
+        if guess:
+            return guess
+        return self._make_medium_move(board, revealed)
 
     def _make_hard_move(self, board: np.ndarray, revealed: np.ndarray):
         unrevealed_indices = np.where(revealed == False)
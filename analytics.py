@@ -0,0 +1,182 @@
+"""
+Minesweeper Board Analytics Module
+
+Module Name: analytics.py
+Description: Rates boards by difficulty. Computes 3BV (minimum clicks needed to clear a
+             board), opening counts and island statistics for a whole batch of boards
+             at once using vectorized connected-component labelling.
+
+Inputs/Output:
+    - Many to different functions:
+        - label_components(mask, topology) -> labels, component ids of True cells per board
+        - board_stats(boards, topology) -> dict, per-board 3BV and region statistics
+        - benchmark(count, rows, cols, num_mines, chunk) -> float, boards analysed per minute
+
+External Sources:
+    - Numpy
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import time
+import argparse
+import numpy as np
+from board_functions import generate_boards
+from topology import get_topology
+
+############################################################
+# Connected Components
+############################################################
+def _neighbor_columns(values, topology, fill):
+    """
+    Value of each neighbour slot for every cell, one (count, cells) array per slot.
+    Gathering a column at a time keeps every array contiguous, which is far faster
+    than one (count, cells, 8) fancy-indexed gather.
+    """
+    count, size = values.shape
+    padded = np.empty((count, size + 1), dtype=values.dtype)
+    padded[:, :size] = values
+    padded[:, size] = fill
+    return [padded[:, topology.table[:, k]] for k in range(topology.table.shape[1])]
+
+def _box_min(values, topology, fill):
+    """
+    Minimum over each cell's 3x3 neighbourhood (itself included) on (count, rows, cols) arrays.
+    The 3x3 minimum is separable, so it is two passes of three shifted slices each.
+    """
+    if topology.wrap:
+        padded = np.pad(values, ((0, 0), (1, 1), (1, 1)), mode='wrap')
+    else:
+        padded = np.pad(values, ((0, 0), (1, 1), (1, 1)), constant_values=fill)
+    rows = np.minimum(np.minimum(padded[:, :, :-2], padded[:, :, 1:-1]), padded[:, :, 2:])
+    return np.minimum(np.minimum(rows[:, :-2], rows[:, 1:-1]), rows[:, 2:])
+
+def label_components(mask, topology):
+    """
+    Label 8-connected regions of True cells on every board of a batch.
+    Each region is labelled with the smallest flat index it contains.
+    Args:
+        mask (np.ndarray): (count, cells) bool array
+        topology (Topology): Neighbour tables of the board shape
+    Returns:
+        np.ndarray: (count, cells) labels, `topology.size` for cells outside the mask
+    """
+    count, size = mask.shape
+    shape = (topology.rows, topology.cols)
+    sentinel = size
+    dtype = np.uint16 if size < np.iinfo(np.uint16).max else np.int32
+    result = np.where(mask, np.arange(size, dtype=dtype), dtype(sentinel))
+    active = np.arange(count)
+    labels, active_mask = result, mask
+    while active.size:
+        # Take the smallest label in each cell's neighbourhood (min propagation) ...
+        merged = _box_min(labels.reshape(-1, *shape), topology, sentinel).reshape(-1, size)
+        merged[~active_mask] = sentinel
+        # ... then jump each label to its own label's label (pointer jumping)
+        padded = np.empty((len(active), size + 1), dtype=dtype)
+        padded[:, :size] = merged
+        padded[:, size] = sentinel
+        merged = np.take_along_axis(padded, merged.astype(np.intp), axis=1)
+        # Boards whose labels stopped changing are finished; keep iterating the rest
+        changed = (merged != labels).any(axis=1)
+        result[active] = merged
+        active, labels, active_mask = active[changed], merged[changed], active_mask[changed]
+    return result
+
+def _count_components(labels, mask):
+    """Number of regions per board: cells that are their own region's label."""
+    return (mask & (labels == np.arange(labels.shape[1]))).sum(axis=1)
+
+############################################################
+# Board Statistics
+############################################################
+def board_stats(boards, topology=None):
+    """
+    3BV and region statistics for a batch of boards in the generate_board encoding.
+    Args:
+        boards (np.ndarray): (count, rows, cols) boards (-1 mine, 0+ adjacent count)
+        topology (Topology): Neighbour tables (defaults to a bounded board of boards.shape[1:])
+    Returns:
+        dict: Per-board int arrays keyed by
+            'bbbv'            minimum clicks to clear the board (openings + isolated)
+            'openings'        connected regions of empty cells (one click each)
+            'isolated'        numbered cells not bordering an opening (one click each)
+            'islands'         connected groups of isolated cells
+            'largest_opening' cells revealed by the biggest single opening click
+    """
+    count = boards.shape[0]
+    if topology is None:
+        topology = get_topology(boards.shape[1:])
+    size = topology.size
+    flat = boards.reshape(count, size)
+    empty = flat == 0
+    numbered = flat > 0
+
+    opening_labels = label_components(empty, topology)
+    openings = _count_components(opening_labels, empty)
+
+    # A numbered cell is cleared for free if an opening touches it
+    neighbor_labels = _neighbor_columns(opening_labels, topology, size)
+    touches_opening = np.zeros_like(empty)
+    for column in neighbor_labels:
+        touches_opening |= column != size
+    isolated = numbered & ~touches_opening
+    island_labels = label_components(isolated, topology)
+    islands = _count_components(island_labels, isolated)
+
+    # Opening size = its empty cells plus the numbered border they uncover.
+    # A border cell can touch several openings, so count each distinct neighbour label once.
+    board_offset = (np.arange(count, dtype=np.int64) * size)[:, None]
+    hits = [(board_offset + opening_labels)[empty]]
+    for k, column in enumerate(neighbor_labels):
+        new = numbered & (column != size)
+        for earlier in neighbor_labels[:k]:
+            new &= column != earlier
+        hits.append((board_offset + column)[new])
+    sizes = np.bincount(np.concatenate(hits), minlength=count * size).reshape(count, size)
+
+    return {
+        'bbbv': openings + isolated.sum(axis=1),
+        'openings': openings,
+        'isolated': isolated.sum(axis=1),
+        'islands': islands,
+        'largest_opening': sizes.max(axis=1),
+    }
+
+############################################################
+# Throughput Benchmark
+############################################################
+def benchmark(count=100_000, rows=16, cols=30, num_mines=99, chunk=1024, seed=0):
+    """
+    Generate and analyse boards in chunks and report throughput.
+    Args:
+        count (int): Number of boards
+        rows, cols (int): Board shape (default expert 30x16)
+        num_mines (int): Mines per board
+        chunk (int): Boards per vectorized batch
+        seed (int): Random seed
+    Returns:
+        float: Boards analysed per minute
+    """
+    rng = np.random.default_rng(seed)
+    topology = get_topology((rows, cols))
+    total_bbbv = 0
+    start = time.perf_counter()
+    for done in range(0, count, chunk):
+        boards = generate_boards(min(chunk, count - done), rows, cols, num_mines, topology, rng)
+        total_bbbv += int(board_stats(boards, topology)['bbbv'].sum())
+    elapsed = time.perf_counter() - start
+    per_minute = count / elapsed * 60
+    print(f"{count} boards {cols}x{rows} ({num_mines} mines) in {elapsed:.1f}s: "
+          f"{per_minute:,.0f} boards/min, mean 3BV {total_bbbv / count:.1f}")
+    return per_minute
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch 3BV / board difficulty analytics")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--rows", type=int, default=16)
+    parser.add_argument("--cols", type=int, default=30)
+    parser.add_argument("--mines", type=int, default=99)
+    parser.add_argument("--chunk", type=int, default=1024)
+    args = parser.parse_args()
+    benchmark(args.count, args.rows, args.cols, args.mines, args.chunk)
@@ -0,0 +1,176 @@
+"""
+Minesweeper Asset Manager Module
+
+Module Name: assets.py
+Description: Decodes sprites and music tracks on a background thread while the menu is
+             showing, then converts the sprites to the display format and pre-scales them
+             once the window exists, so drawing code can blit them directly. Sound effects
+             are loaded on first play, so importing game modules never touches the audio device.
+
+Inputs:
+    - Sprite files from sprites/
+    - Music files from sounds/
+
+Outputs:
+    - AssetManager class exposing ready-to-blit sprites and preloaded music
+    - get_sound(path) -> Sound, loaded on first use
+    - play_music(music_file, volume, mute) -> None, plays music
+
+External Sources:
+    - Pygame library for image loading, conversion and scaling
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import io
+import threading
+import pygame
+from constants import *
+
+############################################################
+# Asset Tables
+############################################################
+# Board cell sprites, scaled to CELL_SIZE x CELL_SIZE
+CELL_SPRITES = {
+    'clicked': "sprites/clicked.png",
+    'flag': "sprites/flag.png",
+    'basic': "sprites/basic.png",
+    'mine': "sprites/bomb.png",
+    'mineClicked': "sprites/bomb_clicked.png",
+}
+for i in range(1, 9):
+    CELL_SPRITES[f'grid{i}'] = f"sprites/grid_{i}.png"
+
+# End screen sprites keyed you_{win|lose}_{normal|human|ai}, scaled to END_SCREEN_SIZE
+END_SCREEN_SPRITES = {
+    'you_win_normal': "sprites/you_win_normal.png",
+    'you_lose_normal': "sprites/you_lose_normal.png",
+    'you_win_human': "sprites/you_human_win.png",
+    'you_lose_human': "sprites/you_human_lose.png",
+    'you_win_ai': "sprites/you_win_ai.png",
+    'you_lose_ai': "sprites/you_lose_ai.png",
+}
+END_SCREEN_SIZE = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3)
+
+MUSIC_TRACKS = (START_MUSIC_1, START_MUSIC_2, START_MUSIC_3, LOSE_MUSIC, WIN_MUSIC)
+
+############################################################
+# Sound Effects and Music
+############################################################
+class _Silence:
+    """Stands in for a Sound when there is no audio device."""
+    def play(self, *args, **kwargs):
+        pass
+
+    def set_volume(self, volume):
+        pass
+
+_sounds = {}
+
+def get_sound(path):
+    """
+    Sound effect for a file, loaded (and the mixer started) the first time it is asked for.
+    Args:
+        path (str): Sound file path from constants
+    Returns:
+        pygame.mixer.Sound: The sound, or a silent stand-in if audio is unavailable
+    """
+    sound = _sounds.get(path)
+    if sound is None:
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            sound = pygame.mixer.Sound(path)
+        except pygame.error:
+            sound = _Silence()
+        _sounds[path] = sound
+    return sound
+
+def play_music(music_file, volume = 0.1, mute = False):
+    '''
+    Manages playing the background music based on the status of the game and mutes if is_muted is true
+    Args:
+        music_file: the name of the music playing, or a file object holding it (see AssetManager.music)
+        volume: the volune level
+        mute: boolean to determine if the music is muted or not
+
+    '''
+    if not pygame.mixer.get_init():
+        return  # sound disabled
+    if mute == False:
+        loop = True
+        pygame.mixer.music.pause()
+        pygame.mixer.music.load(music_file)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(-1 if loop else 0)
+    else:
+        pygame.mixer.music.pause()
+
+############################################################
+# Asset Manager Class
+############################################################
+class AssetManager:
+    """
+    Loads game assets in the background and prepares them for drawing.
+    Call start() as early as possible, then finalize() after the display mode is set.
+    """
+    def __init__(self):
+        self.sprites = {}
+        self._images = {}
+        self._music = {}
+        self._thread = None
+        self._error = None
+
+    def start(self):
+        """Begin decoding sprites and music tracks on a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._decode, name="asset-loader", daemon=True)
+            self._thread.start()
+        return self
+
+    def _decode(self):
+        # Image decoding does not touch the display, so it is safe off the main thread
+        try:
+            for name, path in {**CELL_SPRITES, **END_SCREEN_SPRITES}.items():
+                self._images[name] = pygame.image.load(path)
+            for path in MUSIC_TRACKS:
+                with open(path, "rb") as f:
+                    self._music[path] = f.read()
+        except (OSError, pygame.error) as error:
+            # Re-raised on the main thread by finalize()
+            self._error = error
+
+    def finalize(self):
+        """
+        Wait for decoding to finish, then convert and scale every sprite.
+        Must run on the main thread after pygame.display.set_mode().
+        Returns:
+            dict: Sprite surfaces keyed by name
+        """
+        self.start()
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        can_convert = pygame.display.get_surface() is not None
+        for name, image in self._images.items():
+            if can_convert:
+                image = image.convert_alpha()
+            size = (CELL_SIZE, CELL_SIZE) if name in CELL_SPRITES else END_SCREEN_SIZE
+            self.sprites[name] = pygame.transform.scale(image, size)
+        return self.sprites
+
+    def load(self):
+        """Load everything synchronously. Returns self."""
+        self.finalize()
+        return self
+
+    def music(self, path):
+        """
+        Source for mixer.music.load: preloaded bytes if ready, otherwise the file path.
+        Args:
+            path (str): Music file path from constants
+        Returns:
+            io.BytesIO | str: Music source that never blocks on a decode in progress
+        """
+        data = self._music.get(path)
+        return io.BytesIO(data) if data is not None else path
@@ -0,0 +1,257 @@
+"""
+Minesweeper Batched Environment Module
+
+Module Name: batch_env.py
+Description: Runs thousands of Minesweeper games side by side for AI training. Game state
+             is held as (N, rows, cols) stacks and step() applies one move per game, running
+             flood fill and win/loss checks with array operations across the whole batch.
+             Finished games are reset automatically.
+
+Inputs:
+    - Number of games, board shape and mine count
+    - Actions: one (kind, x, y) row per game, or moves from AIEngine
+
+Outputs:
+    - BatchMinesweeper class returning observations, rewards, done flags and info
+
+External Sources:
+    - Numpy
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import time
+import argparse
+import numpy as np
+from constants import *
+from board_functions import generate_boards
+from topology import get_topology
+
+# Action kinds (first column of an action row)
+REVEAL = 0
+FLAG = 1
+CHORD = 2
+
+# Observation codes for cells the player cannot see; revealed cells show their count 0-8
+HIDDEN = -2
+FLAGGED = -3
+
+############################################################
+# Batched Environment Class
+############################################################
+class BatchMinesweeper:
+    """
+    N independent games advanced together.
+    Args:
+        count (int): Number of games
+        rows, cols (int): Board shape
+        num_mines (int): Mines per board
+        wrap (bool): Play on a torus board
+        seed (int): Random seed, None for nondeterministic boards
+        first_click_safe (bool): Regenerate a board if its first reveal hits a mine, as the game does
+    """
+    def __init__(self, count, rows=GRID_SIZE, cols=GRID_SIZE, num_mines=10, wrap=False, seed=None, first_click_safe=True):
+        self.count = count
+        self.rows = rows
+        self.cols = cols
+        self.num_mines = num_mines
+        self.first_click_safe = first_click_safe
+        self.topology = get_topology((rows, cols), wrap)
+        self.rng = np.random.default_rng(seed)
+        self.board = np.empty((count, rows, cols), dtype=np.int8)
+        self.revealed = np.zeros((count, rows, cols), dtype=bool)
+        self.flagged = np.zeros((count, rows, cols), dtype=bool)
+        self.started = np.zeros(count, dtype=bool)
+        self.wins = 0
+        self.losses = 0
+        self.reset()
+
+    def reset(self, games=None):
+        """
+        Start new games.
+        Args:
+            games: Bool mask or indices of games to reset, None for all
+        Returns:
+            np.ndarray: Observations of every game
+        """
+        if games is None:
+            games = np.arange(self.count)
+        games = np.flatnonzero(games) if np.asarray(games).dtype == bool else np.asarray(games)
+        if games.size:
+            self.board[games] = generate_boards(games.size, self.rows, self.cols, self.num_mines, self.topology, self.rng)
+            self.revealed[games] = False
+            self.flagged[games] = False
+            self.started[games] = False
+        return self.observe()
+
+    def observe(self):
+        """
+        What a player sees: counts of revealed cells, HIDDEN or FLAGGED elsewhere.
+        Returns:
+            np.ndarray: (count, rows, cols) int8 observations
+        """
+        hidden = np.where(self.flagged, np.int8(FLAGGED), np.int8(HIDDEN))
+        return np.where(self.revealed, self.board, hidden)
+
+    def step(self, actions):
+        """
+        Apply one move to every game.
+        Args:
+            actions: (count, 3) int array of (kind, x, y) rows, kind REVEAL, FLAG or CHORD
+        Returns:
+            tuple: (observations, rewards, dones, info)
+                observations (np.ndarray): After auto-reset of finished games
+                rewards (np.ndarray): +1 for a win, -1 for a loss, 0 otherwise
+                dones (np.ndarray): True for games that ended this step
+                info (dict): 'won', 'lost' masks, 'revealed' cells opened per game,
+                             'final_observation' of finished games before their reset
+        """
+        actions = np.asarray(actions, dtype=np.intp).reshape(self.count, 3)
+        kind, cell = actions[:, 0], actions[:, 1] * self.cols + actions[:, 2]
+        games = np.arange(self.count)
+        size = self.topology.size
+        board = self.board.reshape(self.count, size)
+        revealed = self.revealed.reshape(self.count, size)
+        flagged = self.flagged.reshape(self.count, size)
+
+        # Flags toggle on hidden cells only
+        hidden = ~revealed[games, cell]
+        flagging = (kind == FLAG) & hidden
+        flagged[games[flagging], cell[flagging]] ^= True
+
+        revealing = (kind == REVEAL) & hidden
+        if self.first_click_safe:
+            # Ensure first click is not a mine
+            unsafe = revealing & ~self.started & (board[games, cell] == -1)
+            while unsafe.any():
+                redo = games[unsafe]
+                board[redo] = generate_boards(redo.size, self.rows, self.cols, self.num_mines, self.topology, self.rng).reshape(redo.size, size)
+                unsafe[redo] = board[redo, cell[redo]] == -1
+            self.started |= revealing
+        lost = revealing & (board[games, cell] == -1)
+        seeds = np.zeros((self.count, size), dtype=bool)
+        seeds[games[revealing & ~lost], cell[revealing & ~lost]] = True
+
+        chording = kind == CHORD
+        if chording.any():
+            chord_lost, chord_seeds = self._chord_targets(games[chording], cell[chording])
+            lost[chording] |= chord_lost
+            seeds[chording] |= chord_seeds
+
+        before = revealed.sum(axis=1)
+        self._flood(seeds)
+        opened = revealed.sum(axis=1) - before
+        won = ~lost & np.all(revealed | (board == -1), axis=1)
+
+        rewards = won.astype(np.float32) - lost.astype(np.float32)
+        dones = won | lost
+        self.wins += int(won.sum())
+        self.losses += int(lost.sum())
+        info = {'won': won, 'lost': lost, 'revealed': opened}
+        if dones.any():
+            info['final_observation'] = self.observe()[dones]
+            self.reset(dones)
+        return self.observe(), rewards, dones, info
+
+    def _chord_targets(self, games, cell):
+        """
+        Resolve chords for several games at once.
+        Args:
+            games: Indices of the chording games
+            cell: Flat index of the chorded number in each of those games
+        Returns:
+            tuple: (lost mask, (len(games), cells) mask of cells to reveal)
+        """
+        size = self.topology.size
+        rows = np.arange(games.size)[:, None]
+        neighbors = self.topology.table[cell]  # (chords, 8), `size` marks a missing neighbour
+
+        def padded(array):
+            # one extra column so the `size` sentinel reads as False / 0
+            out = np.zeros((games.size, size + 1), dtype=array.dtype)
+            out[:, :size] = array.reshape(self.count, size)[games]
+            return out
+
+        board, revealed, flagged = padded(self.board), padded(self.revealed), padded(self.flagged)
+        number = board[rows[:, 0], cell]
+        # A chord only fires on a revealed number whose adjacent flags match its count
+        valid = revealed[rows[:, 0], cell] & (number > 0) & (flagged[rows, neighbors].sum(axis=1) == number)
+        targets = valid[:, None] & (neighbors < size) & ~revealed[rows, neighbors] & ~flagged[rows, neighbors]
+        lost = (targets & (board[rows, neighbors] == -1)).any(axis=1)
+        targets &= ~lost[:, None]
+        seeds = np.zeros((games.size, size + 1), dtype=bool)
+        seeds[np.broadcast_to(rows, neighbors.shape)[targets], neighbors[targets]] = True
+        return lost, seeds[:, :size]
+
+    def _flood(self, seeds):
+        """Reveal the seed cells of every game and flood-fill all games together."""
+        size = self.topology.size
+        board = self.board.reshape(self.count, size)
+        revealed = self.revealed.reshape(self.count, size)
+        active = np.flatnonzero(seeds.any(axis=1))
+        frontier = seeds[active] & ~revealed[active]
+        revealed[active] |= frontier
+        # Expand empty cells one ring at a time; drop games whose fill has finished
+        while active.size:
+            empty = frontier & (board[active] == 0)
+            keep = empty.any(axis=1)
+            active, empty = active[keep], empty[keep]
+            if not active.size:
+                break
+            # Neighbours of an empty cell are never mines, so reveal every hidden one
+            frontier = self.topology.batch_any(empty) & ~revealed[active]
+            revealed[active] |= frontier
+
+    ############################################################
+    # Move Sources
+    ############################################################
+    def ai_actions(self, engines):
+        """
+        Ask AIEngines for one reveal per game through the usual make_move interface.
+        Args:
+            engines: One AIEngine for every game, or a list with one per game
+        Returns:
+            np.ndarray: (count, 3) action rows
+        """
+        if not isinstance(engines, (list, tuple)):
+            engines = [engines] * self.count
+        actions = np.zeros((self.count, 3), dtype=np.intp)
+        for i, engine in enumerate(engines):
+            actions[i, 1:] = engine.make_move(board=self.board[i], revealed=self.revealed[i])
+        return actions
+
+    def random_actions(self):
+        """
+        Reveal a uniformly random hidden, unflagged cell in every game.
+        Returns:
+            np.ndarray: (count, 3) action rows
+        """
+        size = self.topology.size
+        open_cells = ~(self.revealed | self.flagged).reshape(self.count, size)
+        keys = np.where(open_cells, self.rng.random((self.count, size)), 2.0)
+        cell = keys.argmin(axis=1)
+        return np.stack([np.full(self.count, REVEAL), cell // self.cols, cell % self.cols], axis=1)
+
+############################################################
+# Throughput Benchmark
+############################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batched Minesweeper environment throughput")
+    parser.add_argument("--games", type=int, default=4096)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=GRID_SIZE)
+    parser.add_argument("--cols", type=int, default=GRID_SIZE)
+    parser.add_argument("--mines", type=int, default=10)
+    parser.add_argument("--ai", choices=[d.name for d in AIDifficulty], help="drive games with an AIEngine instead of random moves")
+    args = parser.parse_args()
+
+    env = BatchMinesweeper(args.games, args.rows, args.cols, args.mines, seed=0)
+    if args.ai:
+        from ai import AIEngine
+        engine = AIEngine(AIDifficulty[args.ai], env.topology)
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        env.step(env.ai_actions(engine) if args.ai else env.random_actions())
+    elapsed = time.perf_counter() - start
+    print(f"{args.games * args.steps / elapsed:,.0f} moves/s over {args.games} games; "
+          f"{env.wins} wins, {env.losses} losses")
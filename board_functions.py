@@ -7,10 +7,12 @@ Description: Stores functions related to the game board and board management.
 
 Inputs/Output: 
     - Many to different functions:
-        - generate_board(size, num_mines) -> board
-        - play_music(music_file, volume) -> None, plays music
-        - reveal(board, revealed, x, y) -> None, updates reveal array
-        - flag(board, revealed, flagged, x, y) -> None, updates flagged array
+        - generate_board(size, num_mines, topology) -> board
+        - generate_boards(count, rows, cols, num_mines, topology, rng) -> boards, batched generate_board
+        - flood_reveal(board, revealed, seeds, topology) -> newly revealed indices, silent batched reveal
+        - reveal(board, revealed, x, y, topology, sound) -> newly revealed indices, updates reveal array
+        - flag(board, revealed, flagged, x, y, sound) -> bool, updates flagged array
+        - chord(board, revealed, flagged, x, y, topology, sound) -> newly revealed indices, hit_mine
         - draw_board(surface, board, revealed, flagged, sprites, fonts, status_text, num_mines, flag_count, restart_btn, quit_btn) -> None, draws board
         - restart_game(num_mines) -> board, revealed, flagged, start, game_over
 
@@ -24,82 +26,111 @@ Creation Date: 9/24/2025
 import numpy as np
 from constants import *
 import pygame
-from pygame.locals import * #for sound
-from pygame import mixer #for sound
 from utility_functions import *
+from assets import get_sound  # sound effects load on first play
+from topology import get_topology
+import telemetry
 
-mixer.init()
-
-sound_mine_reveal = pygame.mixer.Sound(SOUND_MINE_REVEAL)
-sound_flag_place = pygame.mixer.Sound(SOUND_FLAG_PLACE)
-sound_flag_remove = pygame.mixer.Sound(SOUND_FLAG_REMOVE)
-sound_cell_reveal = pygame.mixer.Sound(SOUND_BUTTON_CLICK)
-
-def generate_board(size, num_mines):
+def generate_board(size, num_mines, topology=None):
     """
     Generate board array and place mines with adjacent counts.
     Args:
         size (int): Board size
         num_mines (int): Number of mines
+        topology (Topology): Neighbour tables to count with (defaults to a bounded size x size board)
     Returns:
         np.ndarray: Board array (-1 for mine, 0+ for adjacent count)
     """
-    board = np.zeros((size, size), dtype=int)
+    if topology is None:
+        topology = get_topology((size, size))
     mines = np.random.choice(size * size, num_mines, replace=False)
-    for idx in mines:
-        x, y = divmod(idx, size)   # get x y from just index. basically division with a remainder
-        board[x, y] = -1  # Place mine
-        # Increment adjacent mine counts
-        for i in range(max(0, x - 1), min(size, x + 2)):
-            for j in range(max(0, y - 1), min(size, y + 2)):
-                if board[i, j] != -1:
-                    # Add to adjacent cell's mine count
-                    board[i, j] += 1
-    return board
+    is_mine = np.zeros(size * size, dtype=bool)
+    is_mine[mines] = True
+    # Count adjacent mines for every cell in one scatter over the neighbour table
+    board = topology.neighbor_sum(is_mine).astype(int)
+    board[is_mine] = -1  # Place mines
+    return board.reshape(size, size)
 
-def play_music(music_file, volume = 0.1, mute = False):
-    '''
-    Manages playing the background music based on the status of the game and mutes if is_muted is true
+def generate_boards(count, rows, cols, num_mines, topology=None, rng=None):
+    """
+    Generate a batch of boards at once, in the same encoding as generate_board.
     Args:
-        music_file: the name of the music playing
-        volume: the volune level
-        mute: boolean to determine if the music is muted or not
-
-    '''
-    if mute == False:
-        loop = True
-        mixer.music.pause()
-        mixer.music.load(music_file)
-        mixer.music.set_volume(volume)
-        mixer.music.play(-1 if loop else 0)
-    else:
-        mixer.music.pause()
+        count (int): Number of boards
+        rows, cols (int): Board shape
+        num_mines (int): Number of mines per board
+        topology (Topology): Neighbour tables (defaults to a bounded rows x cols board)
+        rng (np.random.Generator): Random source, None for a fresh default generator
+    Returns:
+        np.ndarray: (count, rows, cols) int8 array (-1 for mine, 0+ for adjacent count)
+    """
+    if topology is None:
+        topology = get_topology((rows, cols))
+    if rng is None:
+        rng = np.random.default_rng()
+    size = rows * cols
+    is_mine = np.zeros((count, size + 1), dtype=bool)  # last column is the padding sentinel
+    if num_mines > 0:
+        # The num_mines smallest random keys of each row pick a uniform set of mine cells
+        mines = np.argpartition(rng.random((count, size)), num_mines - 1, axis=1)[:, :num_mines]
+        np.put_along_axis(is_mine, mines, True, axis=1)
+    boards = is_mine[:, topology.table].sum(axis=2, dtype=np.int8)
+    boards[is_mine[:, :size]] = -1  # Place mines
+    return boards.reshape(count, rows, cols)
 
+def flood_reveal(board, revealed, seeds, topology=None):
+    """
+    Reveal the given cells and flood-fill outwards from any that are empty, without sound.
+    Args:
+        board: Board array
+        revealed: Revealed state array (must be contiguous, it is written through a flat view)
+        seeds: Flat indices of safe, unrevealed cells to reveal
+        topology (Topology): Neighbour tables (defaults to a bounded board of board.shape)
+    Returns:
+        np.ndarray: Flat indices of every newly revealed cell
+    """
+    if topology is None:
+        topology = get_topology(board.shape)
+    flat_board = board.reshape(-1)
+    flat_revealed = revealed.reshape(-1)  # view, writes go to `revealed`
+    frontier = np.unique(np.asarray(seeds, dtype=np.intp))
+    frontier = frontier[~flat_revealed[frontier]]
+    flat_revealed[frontier] = True
+    changed = [frontier]
+    # Expand empty cells (no adjacent mines) one ring at a time
+    while frontier.size:
+        empty = frontier[flat_board[frontier] == 0]
+        neighbors = topology.gather(empty)
+        # Neighbours of an empty cell are never mines, so reveal every hidden one
+        frontier = np.unique(neighbors[~flat_revealed[neighbors]])
+        flat_revealed[frontier] = True
+        changed.append(frontier)
+    return np.concatenate(changed)
 
-def reveal(board, revealed, x, y):
+def reveal(board, revealed, x, y, topology=None, sound=True):
     """
-    Reveal a cell recursively if it is empty.
+    Reveal a cell and flood-fill outwards if it is empty.
     Args:
         board: Board array
         revealed: Revealed state array
         x, y: Cell coordinates (not actual mouse coordinates)
+        topology (Topology): Neighbour tables (defaults to a bounded board of board.shape)
+        sound (bool): Play the reveal/explosion sound effects
+    Returns:
+        np.ndarray: Flat indices of the newly revealed cells (empty if nothing changed)
     """
     if revealed[x, y] or board[x, y] == -1:
-        sound_mine_reveal.play()
-        return
-    revealed[x, y] = True
-    sound_cell_reveal.play()
-    sound_cell_reveal.set_volume(0.2)
-    # recursively reveal if empty cell (No adjacent mines)
-    if board[x, y] == 0:
-        # Recursively reveal adjacent empty cells
-        for i in range(max(0, x - 1), min(GRID_SIZE, x + 2)):
-            for j in range(max(0, y - 1), min(GRID_SIZE, y + 2)):
-                if not revealed[i, j]:
-                    # Reveal neighbor if not already revealed
-                    reveal(board, revealed, i, j)
+        if sound:
+            get_sound(SOUND_MINE_REVEAL).play()
+        return np.empty(0, dtype=np.intp)
+    newly_revealed = flood_reveal(board, revealed, [x * board.shape[1] + y], topology)
+    telemetry.emit(telemetry.REVEAL, x, y, newly_revealed.size)
+    if sound:
+        sound_cell_reveal = get_sound(SOUND_BUTTON_CLICK)
+        sound_cell_reveal.play()
+        sound_cell_reveal.set_volume(0.2)
+    return newly_revealed
 
-def flag(board, revealed, flagged, x, y):
+def flag(board, revealed, flagged, x, y, sound=True):
     """
     Place or remove a flag on a cell.
     Args:
@@ -107,15 +138,56 @@ def flag(board, revealed, flagged, x, y):
         revealed: Revealed state array
         flagged: Flagged state array
         x, y: Cell coordinates (not actual mouse coordinates)
+        sound (bool): Play the flag sound effects
+    Returns:
+        bool: True if the flag was toggled
     """
     if revealed[x, y]:
-        return
+        return False
     # Toggle flag state for this cell
     flagged[x, y] = not flagged[x, y]
-    if flagged[x, y]:
-        sound_flag_place.play()
-    else:
-        sound_flag_remove.play()
+    telemetry.emit(telemetry.FLAG, x, y, flagged[x, y])
+    if sound:
+        if flagged[x, y]:
+            get_sound(SOUND_FLAG_PLACE).play()
+        else:
+            get_sound(SOUND_FLAG_REMOVE).play()
+    return True
+
+def chord(board, revealed, flagged, x, y, topology=None, sound=True):
+    """
+    Chord on a revealed number: if its adjacent flags match its count, reveal all of its
+    other hidden neighbours at once (with their flood fills).
+    Args:
+        board: Board array
+        revealed: Revealed state array
+        flagged: Flagged state array
+        x, y: Cell coordinates of the number (not actual mouse coordinates)
+        topology (Topology): Neighbour tables (defaults to a bounded board of board.shape)
+        sound (bool): Play the reveal/explosion sound effects
+    Returns:
+        tuple: (newly revealed flat indices, True if a wrongly flagged neighbour left a mine to be hit)
+    """
+    nothing = np.empty(0, dtype=np.intp)
+    if not revealed[x, y] or board[x, y] <= 0:
+        return nothing, False
+    if topology is None:
+        topology = get_topology(board.shape)
+    neighbors = topology.neighbors(x, y)
+    if flagged.reshape(-1)[neighbors].sum() != board[x, y]:
+        return nothing, False
+    targets = neighbors[~revealed.reshape(-1)[neighbors] & ~flagged.reshape(-1)[neighbors]]
+    if np.any(board.reshape(-1)[targets] == -1):
+        if sound:
+            get_sound(SOUND_MINE_REVEAL).play()
+        return nothing, True
+    newly_revealed = flood_reveal(board, revealed, targets, topology)
+    telemetry.emit(telemetry.CHORD, x, y, newly_revealed.size)
+    if sound and newly_revealed.size:
+        sound_cell_reveal = get_sound(SOUND_BUTTON_CLICK)
+        sound_cell_reveal.play()
+        sound_cell_reveal.set_volume(0.2)
+    return newly_revealed, False
 
 def draw_board(surface, board, revealed, flagged, sprites, fonts, status_text, num_mines, flag_count, restart_btn, quit_btn):
     """
@@ -125,7 +197,7 @@ def draw_board(surface, board, revealed, flagged, sprites, fonts, status_text, n
         board: Board array
         revealed: Revealed state array
         flagged: Flagged state array
-        sprites: Sprite dictionary
+        sprites: Sprite dictionary (pre-scaled to CELL_SIZE, see AssetManager)
         fonts: Font dictionary
         status_text: Status string
         num_mines: Number of mines
@@ -142,7 +214,7 @@ def draw_board(surface, board, revealed, flagged, sprites, fonts, status_text, n
     status_render = fonts['big'].render(status_text, True, RED if "Game Over" in status_text else (GREEN if status_text == "Victory" else BLACK))
     surface.blit(status_render, (MARGIN_LEFT + BOARD_PIXELS//2 - status_render.get_width()//2, 20))
     # Draw controls hint
-    hint = fonts['small'].render("Left-click: uncover  |  Right-click: flag  |  R: restart", True, BLACK)
+    hint = fonts['small'].render("Left: uncover  |  Right: flag  |  Middle: chord  |  R: restart", True, BLACK)
     surface.blit(hint, (MARGIN_LEFT, WINDOW_HEIGHT - 30))
 
     # Draw each cell
@@ -152,17 +224,17 @@ def draw_board(surface, board, revealed, flagged, sprites, fonts, status_text, n
             rect = pygame.Rect(MARGIN_LEFT + y * CELL_SIZE, MARGIN_TOP + x * CELL_SIZE, CELL_SIZE, CELL_SIZE)
             if revealed[x, y]:
                 # Reveal cell
-                surface.blit(pygame.transform.scale(sprites['clicked'], (CELL_SIZE, CELL_SIZE)), rect)
+                surface.blit(sprites['clicked'], rect)
                 if board[x, y] == -1:
-                    surface.blit(pygame.transform.scale(sprites['mineClicked'], (CELL_SIZE, CELL_SIZE)), rect)
+                    surface.blit(sprites['mineClicked'], rect)
                 elif board[x, y] > 0:
-                    surface.blit(pygame.transform.scale(sprites[f'grid{board[x,y]}'], (CELL_SIZE, CELL_SIZE)), rect)
+                    surface.blit(sprites[f'grid{board[x,y]}'], rect)
             elif flagged[x, y]:
                 # Draw flag
-                surface.blit(pygame.transform.scale(sprites['flag'], (CELL_SIZE, CELL_SIZE)), rect)
+                surface.blit(sprites['flag'], rect)
             else:
                 # Draw unrevealed cell
-                surface.blit(pygame.transform.scale(sprites['basic'], (CELL_SIZE, CELL_SIZE)), rect)
+                surface.blit(sprites['basic'], rect)
             pygame.draw.rect(surface, GRID_COLOR, rect, 1)
             # Draw grid border for each cell
     draw_labels(surface, fonts)
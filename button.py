@@ -22,8 +22,7 @@ Creation Date: 9/24/2025
 import pygame
 #from effects import EffectManager
 from constants import *
-pygame.init()
-button_click_sound = pygame.mixer.Sound(SOUND_BUTTON_CLICK)
+from assets import get_sound
 
 # ---------- Button Helper ----------
 ############################################################
@@ -45,22 +44,48 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
+        self.hovered = False
+        self._surfaces = None  # (normal, hover) pre-rendered on first draw
 
-    def draw(self, surface):
-        """Draw button with hover effect."""
-        mouse_pos = pygame.mouse.get_pos()
-        is_hover = self.rect.collidepoint(mouse_pos)
+    @property
+    def bounds(self):
+        """Screen area the button paints."""
+        return self.rect
+
+    def _render_states(self):
+        """Render the normal and hover looks once; the label never changes."""
+        surfaces = []
+        for fill in (self.color, self.hover_color):
+            surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, fill, surf.get_rect(), border_radius=6)
+            text_surf = self.font.render(self.text, True, self.text_color)
+            # Center the text on the button
+            surf.blit(text_surf, text_surf.get_rect(center=surf.get_rect().center))
+            surfaces.append(surf)
+        return tuple(surfaces)
+
+    def draw(self, surface, hover=None):
+        """
+        Draw button with hover effect.
+        Args:
+            surface: Pygame surface
+            hover (bool): Hover state to draw, None to check the mouse position
+        """
+        if self._surfaces is None:
+            self._surfaces = self._render_states()
+        if hover is None:
+            hover = self.rect.collidepoint(pygame.mouse.get_pos())
         # Change color if mouse is hovering
-        pygame.draw.rect(surface, self.hover_color if is_hover else self.color, self.rect, border_radius=6)
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        # Center the text on the button
-        surface.blit(text_surf, text_rect)
+        surface.blit(self._surfaces[1 if hover else 0], self.rect)
+
+    def press(self):
+        """Give click feedback."""
+        get_sound(SOUND_BUTTON_CLICK).play()
 
     def is_clicked(self, event):
         """Return True if button is clicked."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
-                button_click_sound.play()
+                self.press()
                 return True
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,267 @@
+"""
+Minesweeper Frame Capture Module
+
+Module Name: capture.py
+Description: Headless recording of games for replays and regression screenshots. The regular
+             draw_board renderer runs under the SDL dummy video driver into off-screen surfaces
+             taken from a small pool; a background encoder thread writes each frame as a PNG or
+             appends its pixel buffer to a raw video stream, then hands the surface back to the
+             pool. The bounded pool is the frame queue: rendering waits only when the encoder
+             is a full pool behind, and no frame is copied on its way to the encoder.
+
+Inputs:
+    - GameJournal of a finished game (replay), or an AI difficulty to play one (command line)
+    - Output path, format (png or raw) and frames held per move
+
+Outputs:
+    - PNG sequence (frame_00000.png, ...) or a raw stream of 32-bit frames; the matching
+      ffmpeg command is printed for raw output
+    - Rendering speed relative to real time
+
+External Sources:
+    - Pygame library
+    - Numpy
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import os
+import sys
+import time
+import queue
+import shutil
+import argparse
+import threading
+import numpy as np
+# Rendering needs no window and recording needs no sound device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+from constants import *
+from button import Button
+from board_functions import draw_board, generate_board
+from utility_functions import load_sprites
+from journal import GameJournal
+
+POOL_SIZE = 8  # Surfaces in flight between the renderer and the encoder
+
+############################################################
+# Frame Recorder Class
+############################################################
+class FrameRecorder:
+    """
+    Pool of off-screen surfaces drained by an encoder thread.
+    Args:
+        output (str): Directory for a PNG sequence, or file for a raw stream
+        fmt (str): "png" or "raw"
+        size (tuple): Frame size in pixels
+        pool_size (int): Surfaces in flight; rendering blocks when all are waiting to be encoded
+    """
+    def __init__(self, output, fmt="png", size=(WINDOW_WIDTH, WINDOW_HEIGHT), pool_size=POOL_SIZE):
+        if fmt not in ("png", "raw"):
+            raise ValueError(f"unknown capture format {fmt!r}")
+        self.output = output
+        self.fmt = fmt
+        self.size = size
+        self.frames = 0
+        self._error = None
+        self._free = queue.Queue()
+        self._pending = queue.Queue()
+        for _ in range(pool_size):
+            self._free.put(pygame.Surface(size, 0, 32))
+        if fmt == "png":
+            os.makedirs(output, exist_ok=True)
+            self._file = None
+        else:
+            self._file = open(output, "wb")
+        self._thread = threading.Thread(target=self._encode, name="frame-encoder", daemon=True)
+        self._thread.start()
+
+    @property
+    def pixel_format(self):
+        """ffmpeg pix_fmt of the raw frames (32-bit pixels in memory order)."""
+        surface = self._free.queue[0] if self._free.queue else pygame.Surface(self.size, 0, 32)
+        masks = surface.get_masks()[:3]
+        order = sorted(zip(masks, "rgb"))  # lowest mask = first byte on a little-endian machine
+        if sys.byteorder == "big":
+            order.reverse()
+        return "".join(channel for _, channel in order) + "0"
+
+    def frame(self):
+        """
+        A free surface to render the next frame into.
+        Returns:
+            pygame.Surface: Pool surface; pass it to submit() when drawn
+        """
+        return self._free.get()
+
+    def submit(self, surface, repeat=1):
+        """
+        Queue a drawn surface for encoding.
+        Args:
+            surface (pygame.Surface): Surface from frame()
+            repeat (int): Times the frame is written, to hold it on screen
+        """
+        if self._error is not None:
+            raise self._error
+        self._pending.put((surface, repeat))
+
+    def close(self):
+        """Encode the remaining frames and stop the encoder thread."""
+        self._pending.put(None)
+        self._thread.join()
+        if self._file is not None:
+            self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def _encode(self):
+        """Encoder loop: write each queued surface, then return it to the pool."""
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            surface, repeat = item
+            try:
+                first = os.path.join(self.output, f"frame_{self.frames:05d}.png")
+                for i in range(repeat):
+                    if self._file is None:
+                        if i == 0:
+                            pygame.image.save(surface, first)
+                        else:
+                            # a held frame is the same image: copy the encoded file
+                            shutil.copyfile(first, os.path.join(self.output, f"frame_{self.frames:05d}.png"))
+                    else:
+                        # the pixel buffer goes straight to the file, no intermediate bytes object
+                        view = surface.get_view("0")
+                        self._file.write(view)
+                        del view  # unlocks the surface
+                    self.frames += 1
+            except (OSError, pygame.error) as error:
+                self._error = error  # re-raised on the rendering thread
+            self._free.put(surface)
+
+############################################################
+# Off-screen Board Renderer
+############################################################
+class BoardRenderer:
+    """
+    draw_board with the game's fonts, sprites and buttons, for surfaces off the screen.
+    Needs a display mode for sprite conversion; under the dummy driver it is never shown.
+    """
+    def __init__(self):
+        pygame.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.sprites = load_sprites()
+        small = pygame.font.Font(FONT_NAME, 22)
+        big = pygame.font.Font(FONT_NAME, 36)
+        self.fonts = {'small': small, 'big': big}
+        # Same bottom buttons as the game
+        button_width, button_height, spacing = 100, 40, 20
+        start_x = MARGIN_LEFT + (BOARD_PIXELS - (2 * button_width + spacing)) // 2
+        button_y = MARGIN_TOP + BOARD_PIXELS + 50
+        self.restart_btn = Button((start_x, button_y, button_width, button_height), "Restart", small)
+        self.quit_btn = Button((start_x + button_width + spacing, button_y, button_width, button_height), "Quit", small)
+
+    def render(self, surface, board, revealed, flagged, status, mines):
+        """Draw one game state onto `surface`."""
+        draw_board(surface, board, revealed, flagged, self.sprites, self.fonts, status, mines,
+                   int(flagged.sum()), self.restart_btn, self.quit_btn)
+
+############################################################
+# Replay
+############################################################
+def replay(journal, mines, recorder, renderer=None, hold=1):
+    """
+    Render a game from its journal, one frame per recorded move.
+    Args:
+        journal (GameJournal): Journal of the game; its moves are re-applied to a blank board
+        mines (int): Mine count shown on the board
+        recorder (FrameRecorder): Destination of the frames
+        renderer (BoardRenderer): Renderer to reuse, None to create one
+        hold (int): Frames each move stays on screen
+    Returns:
+        int: Moves rendered
+    """
+    renderer = renderer or BoardRenderer()
+    board = journal.board
+    revealed = np.zeros(board.shape, dtype=bool)
+    flagged = np.zeros(board.shape, dtype=bool)
+    playback = GameJournal(board, revealed, flagged, journal.topology)
+    playback.redo_stack = journal.undo_stack[::-1]
+
+    status = "Playing"
+    moves = 0
+    while True:
+        surface = recorder.frame()
+        renderer.render(surface, board, revealed, flagged, status, mines)
+        recorder.submit(surface, hold)
+        if playback.redo() is None:
+            return moves
+        moves += 1
+        if playback.game_over:
+            status = "Game Over" if np.any(revealed & (board == -1)) else "Victory"
+
+def play_ai_game(difficulty, mines, seed=None):
+    """
+    Play a game with an AIEngine, the way the game's Solve mode does, and return its journal.
+    Args:
+        difficulty (AIDifficulty): AI difficulty
+        mines (int): Number of mines
+        seed (int): Seed for the board and the AI's random choices
+    Returns:
+        GameJournal: Journal of the finished game
+    """
+    from ai import AIEngine
+    if seed is not None:
+        np.random.seed(seed)
+        import random
+        random.seed(seed)
+    ai = AIEngine(difficulty)
+    board = generate_board(GRID_SIZE, mines)
+    journal = GameJournal(board, np.zeros_like(board, dtype=bool), np.zeros_like(board, dtype=bool))
+    start = True
+    while not journal.game_over:
+        # nothing is revealed before the first move, so it is never a chord
+        x, y, ai_mines = ai.next_move(journal.board, journal.revealed, journal.flagged)
+        if ai_mines is not None:
+            _, hit_mine = journal.chord(x, y, ai_mines, sound=False)
+        else:
+            if start:
+                # Ensure first click is not a mine
+                while journal.board[x, y] == -1:
+                    journal.set_board(generate_board(GRID_SIZE, mines))
+                start = False
+            hit_mine = journal.board[x, y] == -1
+            if not hit_mine:
+                journal.reveal(x, y, sound=False)
+        if hit_mine:
+            journal.end_game()
+        elif np.all(journal.revealed | (journal.board == -1)):
+            journal.end_game(reveal_all=False)
+    return journal
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record an AI game headlessly")
+    parser.add_argument("output", help="directory for PNG frames, or file for a raw stream")
+    parser.add_argument("--format", choices=("png", "raw"), default="png")
+    parser.add_argument("--difficulty", choices=[d.name for d in AIDifficulty], default="Medium")
+    parser.add_argument("--mines", type=int, default=10)
+    parser.add_argument("--hold", type=int, default=FPS // 2, help="frames per move (at FPS frames/s)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    journal = play_ai_game(AIDifficulty[args.difficulty], args.mines, args.seed)
+    renderer = BoardRenderer()
+    recorder = FrameRecorder(args.output, args.format)
+    start = time.perf_counter()
+    moves = replay(journal, args.mines, recorder, renderer, args.hold)
+    recorder.close()
+    elapsed = time.perf_counter() - start
+    print(f"{moves} moves, {recorder.frames} frames in {elapsed:.2f}s "
+          f"({recorder.frames / FPS / elapsed:.1f}x real time at {FPS} FPS)")
+    if args.format == "raw":
+        width, height = recorder.size
+        print(f"ffmpeg -f rawvideo -pix_fmt {recorder.pixel_format} -s {width}x{height} "
+              f"-r {FPS} -i {args.output} replay.mp4")
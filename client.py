@@ -0,0 +1,133 @@
+"""
+Minesweeper Thin Client Module
+
+Module Name: client.py
+Description: Pygame front end for a session on server.py. Keeps only what the server has
+             revealed, applies the cell deltas it receives and draws them with the regular
+             draw_board renderer.
+
+Inputs:
+    - User events from Pygame (left-click reveal, right-click flag, middle-click chord, A: AI move, R: new game)
+    - Command line: host, port, mine count, AI difficulty
+
+Outputs:
+    - Rendered Minesweeper window for the remote game
+
+External Sources:
+    - Pygame library
+    - Numpy
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import sys
+import json
+import socket
+import argparse
+import numpy as np
+import pygame
+from constants import *
+from button import Button
+from board_functions import draw_board
+from utility_functions import load_sprites
+
+############################################################
+# Remote Game Class
+############################################################
+class RemoteGame:
+    """
+    Local mirror of a server session, updated from move deltas.
+    Args:
+        host, port: Server address
+    """
+    def __init__(self, host, port):
+        self.sock = socket.create_connection((host, port))
+        self.stream = self.sock.makefile("rwb")
+
+    def request(self, message):
+        """Send one request and wait for its response."""
+        self.stream.write(json.dumps(message).encode() + b"\n")
+        self.stream.flush()
+        response = json.loads(self.stream.readline())
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response
+
+    def new_game(self, mines, ai=None):
+        """Start a game on the server and clear the local mirror."""
+        response = self.request({"op": "new", "size": GRID_SIZE, "mines": mines, "ai": ai})
+        self.board = np.zeros((GRID_SIZE, GRID_SIZE), dtype=int)  # only revealed cells are meaningful
+        self.revealed = np.zeros((GRID_SIZE, GRID_SIZE), dtype=bool)
+        self.flagged = np.zeros((GRID_SIZE, GRID_SIZE), dtype=bool)
+        self.status = response["status"]
+
+    def move(self, message):
+        """Send a move and apply the returned delta."""
+        response = self.request(message)
+        for x, y, value in response.get("cells", ()):
+            self.board[x, y] = value
+            self.revealed[x, y] = True
+        for x, y, state in response.get("flags", ()):
+            self.flagged[x, y] = bool(state)
+        self.status = response["status"]
+
+def main():
+    """
+    Entry point for the thin client. Handles input and draws the mirrored board.
+    """
+    parser = argparse.ArgumentParser(description="Thin Minesweeper client for server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--mines", type=int, default=10)
+    parser.add_argument("--ai", help="AIDifficulty name; press A to let it move")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption(f"Minesweeper client - {args.host}:{args.port}")
+    clock = pygame.time.Clock()
+    small = pygame.font.Font(FONT_NAME, 22)
+    big = pygame.font.Font(FONT_NAME, 36)
+    fonts = {'small': small, 'big': big}
+    sprites = load_sprites()
+
+    button_width, button_height, spacing = 100, 40, 20
+    start_x = MARGIN_LEFT + (BOARD_PIXELS - (2 * button_width + spacing)) // 2
+    button_y = MARGIN_TOP + BOARD_PIXELS + 50
+    restart_btn = Button((start_x, button_y, button_width, button_height), "Restart", small)
+    quit_btn = Button((start_x + button_width + spacing, button_y, button_width, button_height), "Quit", small)
+
+    game = RemoteGame(args.host, args.port)
+    game.new_game(args.mines, args.ai)
+    statuses = {"playing": "Playing", "won": "Victory", "lost": "Game Over"}
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or quit_btn.is_clicked(event):
+                running = False
+            elif restart_btn.is_clicked(event) or (event.type == pygame.KEYDOWN and event.key == pygame.K_r):
+                game.new_game(args.mines, args.ai)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_a and args.ai:
+                game.move({"op": "ai"})
+            elif event.type == pygame.MOUSEBUTTONDOWN and game.status == "playing":
+                x = (event.pos[1] - MARGIN_TOP) // CELL_SIZE
+                y = (event.pos[0] - MARGIN_LEFT) // CELL_SIZE
+                if 0 <= x < GRID_SIZE and 0 <= y < GRID_SIZE:
+                    if event.button == 1:  # Left-click
+                        game.move({"op": "reveal", "x": x, "y": y})
+                    elif event.button == 3:  # Right-click to flag
+                        game.move({"op": "flag", "x": x, "y": y})
+                    elif event.button == 2:  # Middle-click to chord
+                        game.move({"op": "chord", "x": x, "y": y})
+
+        draw_board(screen, game.board, game.revealed, game.flagged, sprites, fonts, statuses[game.status],
+                   args.mines, int(game.flagged.sum()), restart_btn, quit_btn)
+        pygame.display.flip()
+        clock.tick(FPS)
+
+    pygame.quit()
+    sys.exit()
+
+if __name__ == "__main__":
+    main()
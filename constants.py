@@ -29,6 +29,10 @@ MARGIN_TOP = 60  # Top margin for board
 WINDOW_PADDING = 20  # Padding around window
 FONT_NAME = None  # Default font
 FPS = 60  # Frames per second
+END_SCREEN_MS = 2000  # How long the win/lose overlay stays up
+SERVER_PORT = 8581  # Default port of the session server (server.py)
+PATTERN_CACHE_FILE = 'patterns.json'  # Expert AI pattern cache, warm-loaded at start and saved on quit
+PATTERN_CACHE_SIZE = 65536  # Most patterns kept in memory
 is_muted = False
 
 
@@ -39,6 +43,7 @@ class AIDifficulty(Enum):
     Easy = 1
     Medium = 2
     Hard = 3
+    Expert = 4
 
 class AIMode(Enum):
     Off = 1
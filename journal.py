@@ -0,0 +1,215 @@
+"""
+Minesweeper Move Journal Module
+
+Module Name: journal.py
+Description: Records every reveal, flag, chord and game-over transition as a reversible delta
+             so moves can be undone/redone in time proportional to the cells they changed.
+             The AI pushes and pops hypothetical mine flags on a journal for lookahead
+             instead of copying the board arrays.
+
+Inputs:
+    - board, revealed, flagged arrays of the running game
+    - Moves (cell coordinates) to apply
+
+Outputs:
+    - Delta class describing one move
+    - GameJournal class that applies, undoes and redoes moves in place
+
+External Sources:
+    - Numpy
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import numpy as np
+from board_functions import reveal, flag, chord
+
+NO_CELLS = np.empty(0, dtype=np.intp)
+NO_CELLS.setflags(write=False)
+
+############################################################
+# Delta Class
+############################################################
+class Delta:
+    """
+    One reversible move.
+    Args:
+        revealed (np.ndarray): Flat indices the move revealed
+        flagged (np.ndarray): Flat indices whose flag the move toggled
+        game_over (bool): True if the move ended the game
+    """
+    __slots__ = ("revealed", "flagged", "game_over")
+
+    def __init__(self, revealed=NO_CELLS, flagged=NO_CELLS, game_over=False):
+        self.revealed = revealed
+        self.flagged = flagged
+        self.game_over = game_over
+
+    def __len__(self):
+        """Number of cells the move changed."""
+        return len(self.revealed) + len(self.flagged)
+
+############################################################
+# Journal Class
+############################################################
+class GameJournal:
+    """
+    Undo/redo history of one game, applied directly to the game's arrays.
+    Args:
+        board: Board array
+        revealed: Revealed state array (contiguous, written in place)
+        flagged: Flagged state array (contiguous, written in place)
+        topology (Topology): Neighbour tables, None for a bounded board of board.shape
+    """
+    def __init__(self, board, revealed, flagged, topology=None):
+        self.board = board
+        self.revealed = revealed
+        self.flagged = flagged
+        self.topology = topology
+        self.game_over = False
+        self.undo_stack = []
+        self.redo_stack = []
+        # flat views share memory with the game arrays, so deltas apply in place
+        self._flat_revealed = revealed.reshape(-1)
+        self._flat_flagged = flagged.reshape(-1)
+
+    def set_board(self, board):
+        """Swap in a regenerated board (first-click safety) before any cell is revealed."""
+        self.board = board
+
+    def reveal(self, x, y, sound=True):
+        """
+        Reveal a cell (with flood fill) and record it.
+        Args:
+            x, y: Cell coordinates
+            sound (bool): Play the reveal sound effects
+        Returns:
+            Delta: The recorded move
+        """
+        return self.record(Delta(revealed=reveal(self.board, self.revealed, x, y, self.topology, sound)))
+
+    def flag(self, x, y, sound=True):
+        """
+        Toggle a flag and record it.
+        Args:
+            x, y: Cell coordinates
+            sound (bool): Play the flag sound effects
+        Returns:
+            Delta: The recorded move (empty and unrecorded if no flag was toggled)
+        """
+        if not flag(self.board, self.revealed, self.flagged, x, y, sound):
+            return Delta()  # nothing toggled: the history is left alone
+        return self.record(Delta(flagged=np.array([x * self.board.shape[1] + y], dtype=np.intp)))
+
+    def chord(self, x, y, mines=NO_CELLS, sound=True):
+        """
+        Chord on a revealed number and record it as one move.
+        Args:
+            x, y: Cell coordinates of the number
+            mines: Flat indices of deduced mines to flag first (used by the AI)
+            sound (bool): Play the sound effects
+        Returns:
+            tuple: (Delta, True if the chord hit a mine); a chord that does nothing is not recorded
+        """
+        mines = np.asarray(mines, dtype=np.intp)
+        mines = mines[~self._flat_flagged[mines] & ~self._flat_revealed[mines]]
+        self._flat_flagged[mines] = True
+        revealed, hit_mine = chord(self.board, self.revealed, self.flagged, x, y, self.topology, sound)
+        delta = Delta(revealed=revealed, flagged=mines)
+        if not len(delta) and not hit_mine:
+            return delta, False  # the chord did nothing: the history is left alone
+        return self.record(delta), hit_mine
+
+    def end_game(self, reveal_all=True):
+        """
+        Record the game-over transition.
+        Args:
+            reveal_all (bool): Uncover every hidden cell, as done when a mine is hit
+        Returns:
+            Delta: The recorded move
+        """
+        self.game_over = True
+        if not reveal_all and self.undo_stack:
+            # a win ends on the winning move itself, so undoing that move resumes the game
+            delta = self.undo_stack[-1]
+            delta.game_over = True
+            return delta
+        cells = np.flatnonzero(~self._flat_revealed) if reveal_all else NO_CELLS
+        self._flat_revealed[cells] = True
+        return self.record(Delta(revealed=cells, game_over=True))
+
+    def record(self, delta):
+        """Push an already-applied move; a new move discards the redo history."""
+        self.undo_stack.append(delta)
+        self.redo_stack.clear()
+        return delta
+
+    def undo(self):
+        """
+        Revert the most recent move.
+        Returns:
+            Delta: The reverted move, or None if there is nothing to undo
+        """
+        if not self.undo_stack:
+            return None
+        delta = self.undo_stack.pop()
+        self._revert(delta)
+        self.redo_stack.append(delta)
+        return delta
+
+    def redo(self):
+        """
+        Re-apply the most recently undone move.
+        Returns:
+            Delta: The re-applied move, or None if there is nothing to redo
+        """
+        if not self.redo_stack:
+            return None
+        delta = self.redo_stack.pop()
+        self._apply(delta)
+        self.undo_stack.append(delta)
+        return delta
+
+    ############################################################
+    # Hypothetical moves (AI lookahead)
+    ############################################################
+    def push(self, x, y):
+        """
+        Flag a hidden cell as a hypothetical mine; pair with pop().
+        Only the revealed and flagged arrays are read, never the hidden board,
+        and the redo history is left untouched.
+        Args:
+            x, y: Cell coordinates
+        Returns:
+            Delta: The hypothetical move (empty if the cell is revealed or already flagged)
+        """
+        if self.revealed[x, y] or self.flagged[x, y]:
+            delta = Delta()
+        else:
+            cells = np.array([x * self.board.shape[1] + y], dtype=np.intp)
+            self._flat_flagged[cells] = True
+            delta = Delta(flagged=cells)
+        self.undo_stack.append(delta)
+        return delta
+
+    def pop(self):
+        """
+        Revert the most recent hypothetical move without adding it to the redo history.
+        Returns:
+            Delta: The reverted move
+        """
+        delta = self.undo_stack.pop()
+        self._revert(delta)
+        return delta
+
+    def _apply(self, delta):
+        self._flat_revealed[delta.revealed] = True
+        self._flat_flagged[delta.flagged] ^= True
+        if delta.game_over:
+            self.game_over = True
+
+    def _revert(self, delta):
+        self._flat_revealed[delta.revealed] = False
+        self._flat_flagged[delta.flagged] ^= True
+        if delta.game_over:
+            self.game_over = False
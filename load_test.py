@@ -0,0 +1,101 @@
+"""
+Minesweeper Server Load Test Module
+
+Module Name: load_test.py
+Description: Opens many concurrent sessions against server.py and plays games as fast as
+             the server answers, then reports request throughput and latency percentiles.
+             Clients reveal random hidden cells from the deltas they receive, or ask the
+             server's AIEngine to move.
+
+Inputs:
+    - Command line: host, port, number of sessions, duration, board settings, AI difficulty
+
+Outputs:
+    - Printed throughput (requests/s, games/s) and p50/p95/p99/max latency
+
+External Sources:
+    - asyncio (Python standard library)
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import json
+import time
+import random
+import asyncio
+import argparse
+from constants import SERVER_PORT
+
+############################################################
+# Load Test Client
+############################################################
+async def run_session(host, port, size, mines, ai, deadline, latencies, totals):
+    """
+    Play games on one connection until the deadline.
+    Args:
+        host, port: Server address
+        size, mines (int): Board settings
+        ai (str): AIDifficulty name to let the server move, None to move randomly
+        deadline (float): time.perf_counter() value to stop at
+        latencies (list): Request latencies in seconds, appended to
+        totals (dict): 'games' counter, updated in place
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def request(message):
+        start = time.perf_counter()
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        return response
+
+    try:
+        while time.perf_counter() < deadline:
+            await request({"op": "new", "size": size, "mines": mines, "ai": ai})
+            hidden = {(x, y) for x in range(size) for y in range(size)}
+            status = "playing"
+            while status == "playing" and time.perf_counter() < deadline:
+                if ai:
+                    response = await request({"op": "ai"})
+                else:
+                    x, y = random.choice(tuple(hidden))
+                    response = await request({"op": "reveal", "x": x, "y": y})
+                # Only the changed cells come back; track what is still hidden
+                hidden.difference_update((x, y) for x, y, _ in response["cells"])
+                status = response["status"]
+            totals['games'] += status != "playing"
+    finally:
+        writer.close()
+
+async def load_test(host, port, sessions, duration, size, mines, ai):
+    """Run the sessions concurrently and print the report."""
+    latencies = []
+    totals = {'games': 0}
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(run_session(host, port, size, mines, ai, deadline, latencies, totals)
+                           for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+    print(f"{sessions} sessions, {elapsed:.1f}s: {len(latencies) / elapsed:,.0f} requests/s, "
+          f"{totals['games'] / elapsed:,.1f} games/s")
+    if latencies:
+        print(f"latency ms: p50 {percentile(50):.2f}  p95 {percentile(95):.2f}  "
+              f"p99 {percentile(99):.2f}  max {latencies[-1] * 1000:.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test for server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--mines", type=int, default=10)
+    parser.add_argument("--ai", help="AIDifficulty name, e.g. Medium, to let the server's AI play")
+    args = parser.parse_args()
+    asyncio.run(load_test(args.host, args.port, args.sessions, args.duration, args.size, args.mines, args.ai))
@@ -0,0 +1,282 @@
+"""
+Minesweeper Pattern Cache Module
+
+Module Name: patterns.py
+Description: Cache of local frontier deductions for the AI. The 5x5 window around a revealed
+             number (revealed counts, hidden cells, off-board walls) is normalised over the 8
+             rotations and reflections, so a 1-2-1 along a wall or in a corner maps to the same
+             key wherever it appears. Keys map to the safe and mine cells the window proves,
+             held in a bounded LRU that can be saved to disk and warm-loaded by later runs
+             and simulator workers.
+
+Inputs/Output:
+    - Many to different functions:
+        - PatternCache.safe_cells(board, revealed, topology) -> generator of safe flat indices
+        - PatternCache.save(path) / PatternCache.load(path) -> persist and warm-load entries
+        - PatternCache.stats -> dict with hits, misses, evictions, size and hit rate
+
+External Sources:
+    - Numpy
+    - json (Python standard library)
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import os
+import json
+import argparse
+from collections import OrderedDict
+from functools import lru_cache
+import numpy as np
+from topology import get_topology
+from solver import solve_constraints
+
+WINDOW = 5  # Side of the window; the 3x3 numbers in its middle see only cells inside it
+
+# Window codes: revealed cells use their count 0-8
+HIDDEN_CODE = 9  # unrevealed (flags included, they are not trusted)
+WALL_CODE = 10   # off the board
+
+############################################################
+# Window Geometry
+############################################################
+def _symmetries():
+    """Position permutations of the 8 rotations/reflections of the window, as an (8, 25) table."""
+    base = np.arange(WINDOW * WINDOW).reshape(WINDOW, WINDOW)
+    perms = []
+    for k in range(4):
+        rotated = np.rot90(base, k)
+        perms.append(rotated.ravel())
+        perms.append(np.fliplr(rotated).ravel())
+    return np.stack(perms)
+
+SYMMETRIES = _symmetries()
+# A window is a 25-digit base-11 number, split in two so each half fits in int64
+_SPLIT = 13
+_HIGH_WEIGHTS = 11 ** np.arange(_SPLIT - 1, -1, -1, dtype=np.int64)
+_LOW_WEIGHTS = 11 ** np.arange(WINDOW * WINDOW - _SPLIT - 1, -1, -1, dtype=np.int64)
+
+def _canonical(windows):
+    """
+    Canonical keys of many windows: the smallest of their 8 symmetric variants.
+    Args:
+        windows (np.ndarray): (n, 25) window codes
+    Returns:
+        tuple: (keys as python ints, index into SYMMETRIES of the variant chosen for each window)
+    """
+    variants = windows[:, SYMMETRIES].astype(np.int64)  # (n, 8, 25)
+    high = variants[..., :_SPLIT] @ _HIGH_WEIGHTS
+    low = variants[..., _SPLIT:] @ _LOW_WEIGHTS
+    # lexicographic minimum of (high, low) over the 8 variants
+    low = np.where(high == high.min(axis=1, keepdims=True), low, np.iinfo(np.int64).max)
+    chosen = low.argmin(axis=1)
+    rows = np.arange(len(windows))
+    scale = 11 ** (WINDOW * WINDOW - _SPLIT)
+    keys = [h * scale + l for h, l in zip(high[rows, chosen].tolist(), low[rows, chosen].tolist())]
+    return keys, chosen
+
+@lru_cache(maxsize=None)
+def _window_table(rows, cols, wrap):
+    """
+    (size, 25) flat indices of the window around every cell; `size` marks off-board cells.
+    """
+    size = rows * cols
+    xs, ys = np.divmod(np.arange(size), cols)
+    half = WINDOW // 2
+    columns = []
+    for dx in range(-half, half + 1):
+        for dy in range(-half, half + 1):
+            nx, ny = xs + dx, ys + dy
+            if wrap:
+                nx, ny = nx % rows, ny % cols
+                ok = np.ones(size, dtype=bool)
+            else:
+                ok = (nx >= 0) & (nx < rows) & (ny >= 0) & (ny < cols)
+            columns.append(np.where(ok, nx * cols + ny, size))
+    return np.stack(columns, axis=1)
+
+def _deduce(window):
+    """
+    Safe and mine positions proven by the numbers in the middle 3x3 of a window.
+    Args:
+        window (np.ndarray): 25 window codes
+    Returns:
+        tuple: (safe positions, mine positions) as sorted tuples
+    """
+    rows = []
+    for r in range(1, WINDOW - 1):
+        for c in range(1, WINDOW - 1):
+            number = window[r * WINDOW + c]
+            if number > 8:
+                continue
+            hidden = tuple((r + dr) * WINDOW + c + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                           if window[(r + dr) * WINDOW + c + dc] == HIDDEN_CODE)
+            if hidden:
+                rows.append((hidden, int(number)))
+    if not rows:
+        return (), ()
+    safe, mines = solve_constraints(rows)
+    return tuple(sorted(safe)), tuple(sorted(mines))
+
+############################################################
+# Pattern Cache Class
+############################################################
+class PatternCache:
+    """
+    Bounded LRU of canonical window -> deduction.
+    Args:
+        capacity (int): Most windows kept before the least recently used is evicted
+        path (str): File to warm-load from (if it exists) and to save to, None for memory only
+    """
+    def __init__(self, capacity=65536, path=None):
+        self.capacity = capacity
+        self.path = path
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path is not None and os.path.exists(path):
+            try:
+                self.load(path)
+            except (OSError, ValueError):
+                pass  # unreadable cache file: start cold, it is rewritten on save
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self):
+        """Hit, miss and eviction counters."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self._entries), 'capacity': self.capacity,
+                'hit_rate': self.hits / lookups if lookups else 0.0}
+
+    def lookup(self, window):
+        """
+        Deduction for a window, from the cache or computed and stored.
+        Args:
+            window (np.ndarray): 25 window codes
+        Returns:
+            tuple: (safe positions, mine positions) in the window's own frame
+        """
+        window = np.asarray(window).reshape(1, -1)
+        keys, chosen = _canonical(window)
+        return self._lookup(keys[0], SYMMETRIES[chosen[0]], window[0])
+
+    def _lookup(self, key, perm, window):
+        """Cached deduction of a window already reduced to its canonical key and permutation."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = _deduce(window[perm])
+            self._entries[key] = entry
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        # position i of the canonical window is position perm[i] of this one
+        safe, mines = entry
+        return [int(perm[i]) for i in safe], [int(perm[i]) for i in mines]
+
+    def safe_cells(self, board, revealed, topology=None):
+        """
+        Yield cells proven safe by the window around each frontier number, in row-major order.
+        Args:
+            board (np.ndarray): The minesweeper board
+            revealed (np.ndarray): Revealed state array
+            topology (Topology): Neighbour tables, None for a bounded board of board.shape
+        Yields:
+            int: Flat index of a safe hidden cell
+        """
+        topology = topology or get_topology(board.shape)
+        if topology.wrap and min(topology.rows, topology.cols) < WINDOW:
+            return  # the window would overlap itself
+        windows = _window_table(topology.rows, topology.cols, topology.wrap)
+        flat_board = board.reshape(-1)
+        flat_revealed = revealed.reshape(-1)
+        codes = np.full(topology.size + 1, WALL_CODE, dtype=np.uint8)
+        codes[:-1] = np.where(flat_revealed & (flat_board >= 0), flat_board, HIDDEN_CODE)
+
+        frontier = np.flatnonzero(flat_revealed & (flat_board > 0) & (topology.neighbor_sum(~flat_revealed) > 0))
+        if frontier.size == 0:
+            return
+        cells = windows[frontier]
+        frontier_windows = codes[cells]
+        # every frontier window is keyed in one pass; lookups stop at the first safe cell
+        keys, chosen = _canonical(frontier_windows)
+        for i, key in enumerate(keys):
+            safe, _ = self._lookup(key, SYMMETRIES[chosen[i]], frontier_windows[i])
+            for position in safe:
+                yield int(cells[i, position])
+
+    ############################################################
+    # Persistence
+    ############################################################
+    def save(self, path=None):
+        """
+        Write the entries as JSON, most recently used last, replacing the file atomically.
+        Args:
+            path (str): Destination, defaults to the path given at construction
+        """
+        path = path or self.path
+        temp = f"{path}.{os.getpid()}.tmp"
+        entries = [[key, list(safe), list(mines)] for key, (safe, mines) in self._entries.items()]
+        with open(temp, "w") as file:
+            json.dump({'window': WINDOW, 'entries': entries}, file, separators=(",", ":"))
+        os.replace(temp, path)
+
+    def load(self, path):
+        """
+        Warm-load entries saved by save(); loaded entries count as least recently used.
+        The file is plain data (integers only), so a planted file cannot run code.
+        Args:
+            path (str): File written by save()
+        Raises:
+            ValueError: If the file is not a valid cache
+        """
+        with open(path) as file:
+            data = json.load(file)
+        if not isinstance(data, dict) or data.get('window') != WINDOW:
+            return
+        loaded = OrderedDict()
+        entries = data.get('entries')
+        if not isinstance(entries, list):
+            raise ValueError("pattern cache has no entry list")
+        for entry in entries[-self.capacity:]:
+            if not (isinstance(entry, list) and len(entry) == 3 and type(entry[0]) is int
+                    and all(isinstance(cells, list) and all(type(i) is int and 0 <= i < WINDOW * WINDOW for i in cells)
+                            for cells in entry[1:])):
+                raise ValueError(f"bad pattern cache entry {entry!r}")
+            key, safe, mines = entry
+            loaded[key] = (tuple(safe), tuple(mines))
+        current = self._entries
+        self._entries = loaded
+        for key, entry in current.items():
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+############################################################
+# Hit-Rate Report
+############################################################
+if __name__ == "__main__":
+    import time
+    from solver import benchmark
+
+    parser = argparse.ArgumentParser(description="Pattern cache hit rate over Expert AI games")
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--capacity", type=int, default=65536)
+    parser.add_argument("--cache", help="file to warm-load from and save to")
+    args = parser.parse_args()
+
+    patterns = PatternCache(args.capacity, args.cache)
+    start = time.perf_counter()
+    benchmark(args.games, patterns=patterns)
+    print(f"{time.perf_counter() - start:.2f}s, {patterns.stats}")
+    if args.cache:
+        patterns.save()
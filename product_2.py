@@ -41,105 +41,171 @@ Creation Date(Date Team 17 forked this repo): 9/22/25
 """
 # ^ team 17 prologue comment
 
+import time  # Startup profiling
+PROCESS_START = time.perf_counter()
 import pygame  # Pygame for graphics and UI
-import numpy as np  # NumPy for board state management
 import sys  # System exit
+import argparse  # Command line flags
 from constants import *
 from button import Button
-from utility_functions import *
-from board_functions import *
-from ai import AIEngine
-from time import sleep
+from utility_functions import initialize_game, clamp_mines, StartupTimer
+from assets import AssetManager, play_music
+from widgets import WidgetManager, Label
+from time import sleep, perf_counter
+import telemetry
+# NumPy, the board functions and the AI are imported in main() once the menu is done
 
-def display_end_screen(screen, sprites, win: bool, mode: str):
+def display_end_screen(sprites, win: bool, mode: str):
     """
-    Display a 'You Win' or 'You Lose' screen for two seconds before showing the end board.
+    Start showing a 'You Win' or 'You Lose' overlay for END_SCREEN_MS before showing the end board.
+    The game loop keeps running; draw_end_screen() paints the overlay each frame.
 
     Args:
-        screen: Pygame display surface
-        sprites (dict): Dictionary of loaded sprites
+        sprites (dict): Dictionary of loaded sprites (pre-scaled end screens included)
         win (bool): True if the player won, False if lost
         mod(str): "normal", "human" or "ai"
+    Returns:
+        tuple: (image, hide_at) overlay state, hide_at in pygame ticks
     """
-    screen.fill(LIGHT_GRAY)
     key = f"you_{'win' if win else 'lose'}_{mode}"
-    filename = f"sprites/{key}.png"
+    return sprites[key], pygame.time.get_ticks() + END_SCREEN_MS
 
-    img = sprites.get(key)
-    if img is None:
-        img = pygame.image.load(filename)
-        sprites[key] = img
-    scaled_img = pygame.transform.scale(
-        img,
-        (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3)
-    )
-    img_rect = scaled_img.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-    screen.blit(scaled_img, img_rect)
-    pygame.display.flip()
-    pygame.time.wait(2000)
+def draw_end_screen(screen, end_screen):
+    """
+    Draw the win/lose overlay over the current frame while it is still due.
+
+    Args:
+        screen: Pygame display surface
+        end_screen (tuple): Overlay state from display_end_screen, or None
+    Returns:
+        tuple: The overlay state, or None once it has expired
+    """
+    if end_screen is None:
+        return None
+    img, hide_at = end_screen
+    if pygame.time.get_ticks() >= hide_at:
+        return None
+    screen.fill(LIGHT_GRAY)
+    img_rect = img.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+    screen.blit(img, img_rect)
+    return end_screen
+
+def attach_patterns(ai, patterns):
+    """
+    Give the AI the pattern cache while it plays Expert, loading the cache the first time Expert is chosen.
+
+    Args:
+        ai (AIEngine): The game's AI, with its difficulty already set
+        patterns (PatternCache): The cache loaded so far, or None
+    Returns:
+        PatternCache: The loaded cache (saved on quit), or None if Expert has not been played
+    """
+    expert = ai.difficulty == AIDifficulty.Expert
+    if expert and patterns is None:
+        from patterns import PatternCache
+        patterns = PatternCache(PATTERN_CACHE_SIZE, PATTERN_CACHE_FILE)
+    ai.patterns = patterns if expert else None
+    return patterns
 
 def main():
     """
     Main entry point for Minesweeper game. Handles initialization, menu, game loop, and user input.
     """
+    parser = argparse.ArgumentParser(description="EECS581 Project 1: Minesweeper")
+    parser.add_argument("--telemetry", metavar="DIR", help="stream game events to files in DIR")
+    parser.add_argument("--telemetry-format", choices=("jsonl", "binary"), default="jsonl")
+    parser.add_argument("--profile-startup", action="store_true", help="print how long each startup phase takes")
+    args = parser.parse_args()
+    timer = StartupTimer(PROCESS_START, args.profile_startup)
+    timer.mark("imports")
+    if args.telemetry:
+        telemetry.configure(args.telemetry, args.telemetry_format)
+
     pygame.init()
     try:
         pygame.mixer.init()  # Initialize mixer for sound
     except pygame.error:
         print("Warning: Sound disabled due to audio device error.")
+    timer.mark("pygame init")
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("EECS581 Project 1:Minesweeper")
     clock = pygame.time.Clock()
+    timer.mark("window")
+
+    # Decode sprites and music in the background while the menu is up
+    assets = AssetManager().start()
 
     # Sound
-    play_music(START_MUSIC_1) #loads in start menu music
+    play_music(assets.music(START_MUSIC_1)) #loads in start menu music
+    timer.mark("menu music")
 
     # Initialize fonts
     small = pygame.font.Font(FONT_NAME, 22)
     big = pygame.font.Font(FONT_NAME, 36)
     fonts = {'small': small, 'big': big}
 
-    # Load sprite images
-    sprites = load_sprites()
-
-    # Main menu buttons
-    play_button = Button((WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT // 2 - 60, 200, 50), "Play Game", big)
-    quit_button = Button((WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT // 2 + 10, 200, 50), "Quit", big)
-    mute_btn = Button((WINDOW_WIDTH - 110, 10, 100, 40), "Mute", small)
+    # Main menu widgets
+    menu = WidgetManager(LIGHT_GRAY)
+    menu.add(Label((0, 100, WINDOW_WIDTH, big.get_linesize()), "Minesweeper", big, BLUE))
+    play_button = menu.add(Button((WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT // 2 - 60, 200, 50), "Play Game", big))
+    quit_button = menu.add(Button((WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT // 2 + 10, 200, 50), "Quit", big))
+    mute_btn = menu.add(Button((WINDOW_WIDTH - 110, 10, 100, 40), "Mute", small))
+    menu.invalidate()
+    timer.mark("fonts and menu")
     #last_click_by_ai = False #tracks if human or AI clicked last
 
     # Show menu loop
     in_menu = True
+    menu_shown = False
     while in_menu:
-        screen.fill(LIGHT_GRAY)
-        title_text = big.render("Minesweeper", True, BLUE)
-        screen.blit(title_text, (WINDOW_WIDTH // 2 - title_text.get_width() // 2, 100))
-        play_button.draw(screen)
-        quit_button.draw(screen)
-        mute_btn.draw(screen)
+        # Only widgets whose hover/text state changed are repainted
+        dirty_rects = menu.draw(screen)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        if not menu_shown:
+            menu_shown = True
+            timer.mark("first menu frame")
+            timer.report("Menu shown")
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-            if mute_btn.is_clicked(event):
+            clicked = menu.handle_event(event)
+            if clicked is mute_btn:
                 global is_muted
                 is_muted = not is_muted
-                play_music(START_MUSIC_1, mute = is_muted)
-            if play_button.is_clicked(event):
+                play_music(assets.music(START_MUSIC_1), mute = is_muted)
+            if clicked is play_button:
                 in_menu = False
-            if quit_button.is_clicked(event):
+            if clicked is quit_button:
                 pygame.quit()
                 sys.exit()
-        pygame.display.flip()
         clock.tick(FPS)
+    timer.skip()  # time spent in the menu is the player's, not startup
+
+    # Game modules are only needed from here on
+    import numpy as np  # NumPy for board state management
+    from board_functions import draw_board, generate_board, restart_game
+    from ai import AIEngine
+    from journal import GameJournal
+    timer.mark("game modules")
+
+    # Sprites are converted to the display format once the window exists
+    sprites = assets.finalize()
+    end_screen = None
+    timer.mark("sprites")
 
     # Ask for number of mines and initialize game
     mines, difficulty, mode = initialize_game(screen, clock, fonts)
+    timer.skip()
     pygame.event.clear()
     mines = clamp_mines(mines)
     board, revealed, flagged, start, game_over = restart_game(mines)
+    journal = GameJournal(board, revealed, flagged)
     status = "Playing"
     ignore_next_click = True  # Skip leftover click from menu
+    telemetry.emit(telemetry.START, value=mines)
+    started_at = perf_counter()
 
     # Bottom buttons
     button_width, button_height = 100, 40
@@ -152,6 +218,7 @@ def main():
 
     turn = 0 # turn number, so that we can see if it is AI's turn or players turn
     ai = AIEngine(difficulty)
+    patterns = attach_patterns(ai, None)
 
     running = True
     while running:
@@ -159,19 +226,24 @@ def main():
         # if it is AI's turn, ai make move. else check for player events
         if (mode == AIMode.Solver or (mode == AIMode.Alternate and turn % 2 != 0)) and not game_over:
             sleep(1) # sleep for a bit just so ai doesnt go immediately after player
-            # get ai's move
-            ai_x, ai_y = ai.make_move(board=board, revealed=revealed)
+            # get ai's move, preferring a chord that clears several cells in one move
+            ai_x, ai_y, ai_mines = ai.next_move(board, revealed, flagged)
+            if ai_mines is not None:
+                _, hit_mine = journal.chord(ai_x, ai_y, ai_mines)
+            else:
+                hit_mine = board[ai_x, ai_y] == -1
             # copied from their code, just checks if x, y is mine or not and then acts accordingly
-            if board[ai_x, ai_y] == -1:
+            if hit_mine:
                 # AI clicked a bomb — AI loses
-                play_music(LOSE_MUSIC)
-                display_end_screen(screen, sprites, win=False, mode='ai') #shows that ai lost in ai mode
-                revealed[:, :] = True
+                play_music(assets.music(LOSE_MUSIC))
+                end_screen = display_end_screen(sprites, win=False, mode='ai') #shows that ai lost in ai mode
+                journal.end_game()
                 game_over = True
+                telemetry.emit(telemetry.LOSS, ai_x, ai_y, perf_counter() - started_at)
                 #last_click_by_ai = True
                 status = "Game Over"
-            else:
-                reveal(board, revealed, ai_x, ai_y)
+            elif ai_mines is None:
+                journal.reveal(ai_x, ai_y)
             turn += 1 # update turn number
 
         for event in pygame.event.get():
@@ -179,28 +251,51 @@ def main():
                 running = False
             # Restart / Quit buttons
             if restart_btn.is_clicked(event):
-                play_music(START_MUSIC_1, mute = is_muted)
+                play_music(assets.music(START_MUSIC_1), mute = is_muted)
                 mines, difficulty, mode = initialize_game(screen, clock, fonts)
                 ai.set_difficulty(difficulty)
+                patterns = attach_patterns(ai, patterns)
                 pygame.event.clear()
                 mines = clamp_mines(mines)
                 board, revealed, flagged, start, game_over = restart_game(mines)
+                journal = GameJournal(board, revealed, flagged)
+                end_screen = None
                 turn = 0
                 status = "Playing"
                 ignore_next_click = True
+                telemetry.emit(telemetry.RESTART, value=mines)
+                started_at = perf_counter()
             if quit_btn.is_clicked(event):
                 running = False
             # Restart with R key
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-                play_music(START_MUSIC_1)
+                play_music(assets.music(START_MUSIC_1))
                 mines, difficulty, mode = initialize_game(screen, clock, fonts)
                 ai.set_difficulty(difficulty)
+                patterns = attach_patterns(ai, patterns)
                 pygame.event.clear()
                 mines = clamp_mines(mines)
                 board, revealed, flagged, start, game_over = restart_game(mines)
+                journal = GameJournal(board, revealed, flagged)
+                end_screen = None
                 turn = 0
                 status = "Playing"
                 ignore_next_click = True
+                telemetry.emit(telemetry.RESTART, value=mines)
+                started_at = perf_counter()
+            # Undo / redo (Ctrl+Z / Ctrl+Y), only without the AI so turns stay in step
+            elif event.type == pygame.KEYDOWN and event.key in (pygame.K_z, pygame.K_y) and event.mod & pygame.KMOD_CTRL:
+                if mode == AIMode.Off:
+                    journal.undo() if event.key == pygame.K_z else journal.redo()
+                    game_over = journal.game_over
+                    # undoing the first reveal restores first-click safety
+                    start = not revealed.any()
+                    if not game_over:
+                        end_screen = None
+                        status = "Playing"
+                    else:
+                        # a lost game is the only way mines end up revealed
+                        status = "Game Over" if np.any(revealed & (board == -1)) else "Victory"
             # Game input
             elif not game_over:
                 if event.type == pygame.MOUSEBUTTONDOWN and (mode == AIMode.Off or (mode == AIMode.Alternate and turn % 2 != 1)):
@@ -216,52 +311,75 @@ def main():
                                 # Ensure first click is not a mine
                                 while board[x, y] == -1:
                                     board = generate_board(GRID_SIZE, mines)
-                                reveal(board, revealed, x, y)
+                                journal.set_board(board)
+                                journal.reveal(x, y)
                                 start = False
                             else:
                                 if board[x, y] == -1: #clicks on bomb lose condition 
                                     if mode == AIMode.Off:
-                                        play_music(LOSE_MUSIC) #loads in lose music
-                                        display_end_screen(screen, sprites, win=False, mode='normal') #shows that human lost no ai
+                                        play_music(assets.music(LOSE_MUSIC)) #loads in lose music
+                                        end_screen = display_end_screen(sprites, win=False, mode='normal') #shows that human lost no ai
                                     # Hit a mine -> game over
                                     else:
-                                        play_music(LOSE_MUSIC) 
-                                        display_end_screen(screen, sprites, win=False, mode='human') #sets end screen to show that human lost in ai mode
-                                    revealed[:, :] = True
+                                        play_music(assets.music(LOSE_MUSIC)) 
+                                        end_screen = display_end_screen(sprites, win=False, mode='human') #sets end screen to show that human lost in ai mode
+                                    journal.end_game()
                                     status = "Game Over"
                                     game_over = True
+                                    telemetry.emit(telemetry.LOSS, x, y, perf_counter() - started_at)
                                     #last_click_by_ai = False
                                 elif (not revealed[x, y]):
-                                    reveal(board, revealed, x, y)
+                                    journal.reveal(x, y)
                                 else: 
                                     turn -=1
                             turn += 1 # update turn number
                         elif event.button == 3:  # Right-click to flag
                             if not revealed[x, y]:
-                                flag(board, revealed, flagged, x, y)
+                                journal.flag(x, y)
+                        elif event.button == 2 and not start:  # Middle-click to chord
+                            delta, hit_mine = journal.chord(x, y)
+                            if hit_mine: # a wrong flag let the chord uncover a mine
+                                play_music(assets.music(LOSE_MUSIC))
+                                end_screen = display_end_screen(sprites, win=False, mode='normal' if mode == AIMode.Off else 'human')
+                                journal.end_game()
+                                status = "Game Over"
+                                game_over = True
+                                telemetry.emit(telemetry.LOSS, x, y, perf_counter() - started_at)
+                                turn += 1
+                            elif len(delta):
+                                turn += 1 # a chord that revealed cells counts as a move
         # Check for victory
         if not game_over and np.all(revealed | (board == -1)):
             if mode == AIMode.Off:
                 # Normal play victory
-                play_music(WIN_MUSIC)
-                display_end_screen(screen, sprites, win=True, mode="normal") #shows that human wins no AI mode
+                play_music(assets.music(WIN_MUSIC))
+                end_screen = display_end_screen(sprites, win=True, mode="normal") #shows that human wins no AI mode
                 status = "Victory"
             elif (mode == AIMode.Solver or mode == AIMode.Alternate and turn % 2 == 0):
                 # AI just played and cleared board
-                play_music(WIN_MUSIC)
-                display_end_screen(screen, sprites, win=True, mode="ai") #sets ending screen to show that AI wins in ai mode
+                play_music(assets.music(WIN_MUSIC))
+                end_screen = display_end_screen(sprites, win=True, mode="ai") #sets ending screen to show that AI wins in ai mode
                 status = "Victory"
             else:
                 # Human cleared board
-                play_music(WIN_MUSIC)
-                display_end_screen(screen, sprites, win=True, mode="human") #sets end screen to show that human wins in ai mode
+                play_music(assets.music(WIN_MUSIC))
+                end_screen = display_end_screen(sprites, win=True, mode="human") #sets end screen to show that human wins in ai mode
                 status = "Victory"
+            journal.end_game(reveal_all=False)
             game_over = True
+            telemetry.emit(telemetry.WIN, value=perf_counter() - started_at)
 
         draw_board(screen, board, revealed, flagged, sprites, fonts, status, mines, flag_count, restart_btn, quit_btn)
+        end_screen = draw_end_screen(screen, end_screen)
         pygame.display.flip()
+        if timer is not None:
+            timer.mark("first game frame")
+            timer.report("Game ready (menu time excluded)")
+            timer = None
         clock.tick(FPS)
 
+    if patterns is not None and patterns.misses:
+        patterns.save()  # keep what this run learned for the next one
     pygame.quit()
     sys.exit()
 
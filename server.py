@@ -0,0 +1,228 @@
+"""
+Minesweeper Game Server Module
+
+Module Name: server.py
+Description: asyncio server hosting many concurrent Minesweeper sessions on one machine.
+             Each TCP connection is one session, played by a human client or by an
+             AIEngine. Messages are newline-delimited JSON and every move answers with
+             only the cells it changed, never the full board. AI moves are computed on
+             a thread pool so they do not stall other sessions.
+
+Inputs:
+    - JSON requests, one per line:
+        {"op": "new", "mines": 10, "size": 10, "ai": "Medium"}   start a game (ai optional)
+        {"op": "reveal", "x": 3, "y": 4}                          reveal a cell
+        {"op": "flag", "x": 3, "y": 4}                            toggle a flag
+        {"op": "chord", "x": 3, "y": 4}                           chord on a revealed number
+        {"op": "ai"}                                              let the session's AIEngine move
+
+Outputs:
+    - JSON responses, one per line:
+        {"size": 10, "mines": 10, "status": "playing"}            for "new"
+        {"cells": [[x, y, value], ...], "flags": [[x, y, 0|1]], "status": "playing"|"won"|"lost",
+         "move": [x, y]}                                          for moves ("move" only for "ai")
+        {"error": "..."}                                          for bad requests
+
+External Sources:
+    - asyncio (Python standard library)
+    - Numpy
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import os
+import json
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from constants import *
+from board_functions import generate_board, reveal, flag, chord
+from ai import AIEngine
+
+MAX_LINE = 1024  # Longest request accepted, in bytes
+
+############################################################
+# Session Class
+############################################################
+class Session:
+    """
+    State of one game. Kept small: int8/bool arrays, created on "new".
+    Args:
+        size (int): Board size
+        num_mines (int): Number of mines
+        difficulty (AIDifficulty): Difficulty of the session's AIEngine, None for no AI
+    """
+    __slots__ = ("size", "num_mines", "board", "revealed", "flagged", "started", "status", "ai")
+
+    def __init__(self, size, num_mines, difficulty=None):
+        self.size = size
+        self.num_mines = num_mines
+        self.board = generate_board(size, num_mines).astype(np.int8)
+        self.revealed = np.zeros((size, size), dtype=bool)
+        self.flagged = np.zeros((size, size), dtype=bool)
+        self.started = False
+        self.status = "playing"
+        self.ai = AIEngine(difficulty) if difficulty is not None else None
+
+    def _cells(self, indices):
+        """[[x, y, value], ...] for flat cell indices."""
+        xs, ys = np.divmod(indices, self.size)
+        return np.stack([xs, ys, self.board.reshape(-1)[indices]], axis=1).tolist()
+
+    def reveal(self, x, y):
+        """
+        Reveal a cell.
+        Returns:
+            dict: Response with the newly revealed cells and game status
+        """
+        if self.status != "playing":
+            return {"cells": [], "status": self.status}
+        if not self.started:
+            # Ensure first click is not a mine
+            while self.board[x, y] == -1:
+                self.board = generate_board(self.size, self.num_mines).astype(np.int8)
+            self.started = True
+        if self.board[x, y] == -1:
+            # Hit a mine -> game over, uncover everything still hidden
+            changed = np.flatnonzero(~self.revealed)
+            self.revealed[:, :] = True
+            self.status = "lost"
+        else:
+            changed = reveal(self.board, self.revealed, x, y, sound=False)
+            if np.all(self.revealed | (self.board == -1)):
+                self.status = "won"
+        return {"cells": self._cells(changed), "status": self.status}
+
+    def chord(self, x, y, mines=()):
+        """
+        Chord on a revealed number, optionally flagging deduced mines first (AI chords).
+        Returns:
+            dict: Response with the revealed cells, new flags and game status
+        """
+        if self.status != "playing":
+            return {"cells": [], "status": self.status}
+        flat_flagged = self.flagged.reshape(-1)
+        new_flags = [int(m) for m in mines if not flat_flagged[m]]
+        flat_flagged[new_flags] = True
+        changed, hit_mine = chord(self.board, self.revealed, self.flagged, x, y, sound=False)
+        if hit_mine:
+            # A wrong flag let the chord uncover a mine -> game over
+            changed = np.flatnonzero(~self.revealed)
+            self.revealed[:, :] = True
+            self.status = "lost"
+        elif np.all(self.revealed | (self.board == -1)):
+            self.status = "won"
+        flags = [[m // self.size, m % self.size, 1] for m in new_flags]
+        return {"cells": self._cells(changed), "flags": flags, "status": self.status}
+
+    def flag(self, x, y):
+        """
+        Toggle a flag.
+        Returns:
+            dict: Response with the changed flag and game status
+        """
+        if self.status == "playing" and flag(self.board, self.revealed, self.flagged, x, y, sound=False):
+            return {"flags": [[x, y, int(self.flagged[x, y])]], "status": self.status}
+        return {"flags": [], "status": self.status}
+
+############################################################
+# Server Class
+############################################################
+class GameServer:
+    """
+    Accepts connections and runs one Session per connection.
+    Args:
+        executor: Executor for AI moves, None for a default thread pool
+    """
+    def __init__(self, executor=None):
+        self.executor = executor or ThreadPoolExecutor(max_workers=os.cpu_count())
+        self.connections = 0
+        self.requests = 0
+
+    async def handle(self, reader, writer):
+        """Serve one client until it disconnects."""
+        self.connections += 1
+        session = None
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    break
+                try:
+                    request = json.loads(line)
+                    session, response = await self.dispatch(session, request)
+                except (ValueError, KeyError, TypeError, IndexError) as error:
+                    response = {"error": str(error)}
+                self.requests += 1
+                writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def dispatch(self, session, request):
+        """
+        Apply one request.
+        Returns:
+            tuple: (session, response dict)
+        """
+        op = request["op"]
+        if op == "new":
+            size = int(request.get("size", GRID_SIZE))
+            mines = int(request.get("mines", 10))
+            if not (2 <= size <= 64 and 0 < mines < size * size):
+                raise ValueError("bad board size or mine count")
+            ai = request.get("ai")
+            session = Session(size, mines, AIDifficulty[ai] if ai else None)
+            return session, {"size": size, "mines": mines, "status": session.status}
+        if session is None:
+            raise ValueError("no game, send op 'new' first")
+        if op == "ai":
+            if session.ai is None:
+                raise ValueError("session has no AI")
+            if session.status != "playing":
+                return session, {"cells": [], "status": session.status}
+            # AI search runs off the event loop so other sessions keep moving
+            loop = asyncio.get_running_loop()
+            x, y, mines = await loop.run_in_executor(self.executor, session.ai.next_move,
+                                                     session.board, session.revealed, session.flagged)
+            if mines is not None:
+                response = session.chord(x, y, mines)
+            else:
+                response = session.reveal(int(x), int(y))
+            response["move"] = [int(x), int(y)]
+            return session, response
+        x, y = int(request["x"]), int(request["y"])
+        if not (0 <= x < session.size and 0 <= y < session.size):
+            raise ValueError("cell out of range")
+        if op == "reveal":
+            return session, session.reveal(x, y)
+        if op == "flag":
+            return session, session.flag(x, y)
+        if op == "chord":
+            return session, session.chord(x, y)
+        raise ValueError(f"unknown op {op!r}")
+
+async def serve(host="127.0.0.1", port=SERVER_PORT):
+    """Run the server until cancelled."""
+    game_server = GameServer()
+    server = await asyncio.start_server(game_server.handle, host, port, limit=MAX_LINE, backlog=4096)
+    print(f"Minesweeper server on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Minesweeper session server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
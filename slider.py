@@ -66,6 +66,11 @@ class Slider:
             # Move knob to match new value
             self.knob_x = self.rect.left + int((self.value - self.min_val) / (self.max_val - self.min_val) * self.rect.width)
 
+    @property
+    def bounds(self):
+        """Screen area the slider paints: track, knob and value label above it."""
+        return pygame.Rect(self.rect.left - 15, self.rect.top - 40, self.rect.width + 30, 60)
+
     def draw(self, surface):
         """Draw slider track and knob."""
         pygame.draw.rect(surface, DARK_GRAY, self.rect)
@@ -0,0 +1,279 @@
+"""
+Minesweeper Frontier Solver Module
+
+Module Name: solver.py
+Description: Exact deduction for the AI. Every revealed number bordering hidden cells is a
+             linear constraint (sum of its hidden neighbours = number minus known mines) over
+             0/1 frontier variables. Constraints are reduced with integer Gaussian elimination
+             and bound reasoning on the [0, 1] range of each variable to find cells that are
+             certainly safe or certainly mines. Rows are kept between moves and only rebuilt
+             for cells whose neighbourhood changed.
+
+Inputs/Output:
+    - Many to different functions:
+        - solve_constraints(rows) -> (safe, mines), forced variables of a constraint list
+        - FrontierSolver.update(board, revealed) -> None, refreshes changed constraint rows
+        - FrontierSolver.solve() -> (safe, mines), certain cells as flat indices
+        - benchmark(games, rows, cols, num_mines) -> None, compares against AIEngine._find_safe_move
+
+External Sources:
+    - Numpy
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import time
+import argparse
+from math import gcd
+from functools import reduce
+import numpy as np
+from topology import get_topology
+
+############################################################
+# Constraint Reduction
+############################################################
+def _normalize(row):
+    """Divide an integer row by the gcd of its entries, keeping it integral."""
+    divisor = reduce(gcd, (abs(int(v)) for v in row if v), 0)
+    return row // divisor if divisor > 1 else row
+
+def _eliminate(matrix):
+    """
+    Fraction-free Gauss-Jordan elimination of an augmented integer matrix [A | b], in place.
+    Returns:
+        np.ndarray: Non-zero rows of the reduced matrix
+    """
+    rows, cols = matrix.shape
+    pivot_row = 0
+    for col in range(cols - 1):
+        if pivot_row == rows:
+            break
+        candidates = np.flatnonzero(matrix[pivot_row:, col]) + pivot_row
+        if candidates.size == 0:
+            continue
+        pivot = candidates[0]
+        matrix[[pivot_row, pivot]] = matrix[[pivot, pivot_row]]
+        p = matrix[pivot_row, col]
+        for r in np.flatnonzero(matrix[:, col]):
+            if r != pivot_row:
+                # integer combination that zeroes column `col` without fractions
+                matrix[r] = _normalize(matrix[r] * p - matrix[pivot_row] * matrix[r, col])
+        pivot_row += 1
+    return matrix[np.any(matrix != 0, axis=1)]
+
+def _forced_by_bounds(matrix):
+    """
+    Variables forced by a single row because every variable lies in [0, 1].
+    Returns:
+        dict: {column: 0 or 1}
+    """
+    forced = {}
+    coefficients, rhs = matrix[:, :-1], matrix[:, -1]
+    lows = np.where(coefficients < 0, coefficients, 0).sum(axis=1)
+    highs = np.where(coefficients > 0, coefficients, 0).sum(axis=1)
+    for r in range(matrix.shape[0]):
+        for col in np.flatnonzero(coefficients[r]):
+            a = coefficients[r, col]
+            # range the other variables of the row can still reach
+            rest_low = lows[r] - min(a, 0)
+            rest_high = highs[r] - max(a, 0)
+            can_be_one = rest_low + a <= rhs[r] <= rest_high + a
+            can_be_zero = rest_low <= rhs[r] <= rest_high
+            if can_be_one != can_be_zero:
+                forced[int(col)] = int(can_be_one)
+    return forced
+
+def solve_constraints(rows):
+    """
+    Find variables fixed by a set of 0/1 linear constraints.
+    Args:
+        rows (list): (variables, total) pairs, meaning sum of the variables == total
+    Returns:
+        tuple: (safe variables, mine variables) as sets
+    """
+    variables = sorted({v for row_vars, _ in rows for v in row_vars})
+    column = {v: i for i, v in enumerate(variables)}
+    matrix = np.zeros((len(rows), len(variables) + 1), dtype=np.int64)
+    for r, (row_vars, total) in enumerate(rows):
+        matrix[r, [column[v] for v in row_vars]] = 1
+        matrix[r, -1] = total
+
+    values = {}
+    while matrix.size:
+        matrix = _eliminate(matrix)
+        forced = _forced_by_bounds(matrix)
+        if not forced:
+            break
+        # substitute the forced values and reduce again
+        for col, value in forced.items():
+            values[col] = value
+            matrix[:, -1] -= matrix[:, col] * value
+            matrix[:, col] = 0
+    safe = {variables[c] for c, v in values.items() if v == 0}
+    mines = {variables[c] for c, v in values.items() if v == 1}
+    return safe, mines
+
+############################################################
+# Incremental Frontier Solver
+############################################################
+class FrontierSolver:
+    """
+    Keeps one constraint row per revealed number on the frontier and solves them.
+    Args:
+        topology (Topology): Neighbour tables, None for a bounded board of board.shape
+    """
+    def __init__(self, topology=None):
+        self.topology = topology
+        self._fixed_topology = topology is not None
+        self._board = None
+        self._revealed = None
+        self.rows = {}          # number cell -> (hidden unknown neighbours, mines still needed)
+        self.mines = set()      # cells proven to be mines
+        self._cache = {}        # component rows -> (safe, mines)
+
+    def reset(self):
+        """Forget all rows (new game, undo, or a different board)."""
+        self._board = None
+        self._revealed = None
+        self.rows = {}
+        self.mines = set()
+        self._cache = {}
+
+    def update(self, board, revealed):
+        """
+        Bring the constraint rows up to date with the board.
+        Only numbers next to cells that changed since the last call are rebuilt.
+        Args:
+            board (np.ndarray): The minesweeper board
+            revealed (np.ndarray): Revealed state array
+        """
+        flat_revealed = revealed.reshape(-1)
+        if not self._fixed_topology:
+            self.topology = get_topology(board.shape)
+        # a new view of the same memory (e.g. one game of BatchMinesweeper) is the same board;
+        # holding the old array keeps a new board from reusing its address
+        same_board = (self._board is not None and self._board.shape == board.shape
+                      and self._board.ctypes.data == board.ctypes.data)
+        if (not same_board or self._revealed is None
+                or self._revealed.shape != flat_revealed.shape
+                or np.any(self._revealed & ~flat_revealed)):
+            # cells were hidden again or this is another game: start over
+            self.reset()
+            self._board = board
+            self._revealed = np.zeros_like(flat_revealed)
+        changed = np.flatnonzero(flat_revealed != self._revealed)
+        self._revealed = flat_revealed.copy()
+        self.mines.difference_update(changed.tolist())
+        self._rebuild(np.concatenate((changed, self.topology.gather(changed))))
+
+    def _rebuild(self, cells):
+        """Recompute the rows of the given cells."""
+        topology = self.topology
+        flat_board = self._board.reshape(-1)
+        for cell in np.unique(cells).tolist():
+            self.rows.pop(cell, None)
+            if not self._revealed[cell] or flat_board[cell] <= 0:
+                continue
+            neighbors = topology.indices[topology.indptr[cell]:topology.indptr[cell + 1]]
+            hidden = neighbors[~self._revealed[neighbors]].tolist()
+            unknown = tuple(v for v in hidden if v not in self.mines)
+            if unknown:
+                self.rows[cell] = (unknown, int(flat_board[cell]) - (len(hidden) - len(unknown)))
+
+    def _components(self):
+        """Group rows that share variables; each group is solved independently."""
+        parent = {}
+
+        def find(v):
+            while parent.setdefault(v, v) != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            return v
+
+        for variables, _ in self.rows.values():
+            root = find(variables[0])
+            for v in variables[1:]:
+                parent[find(v)] = root
+        groups = {}
+        for cell, row in self.rows.items():
+            groups.setdefault(find(row[0][0]), []).append(row)
+        return groups.values()
+
+    def solve(self):
+        """
+        Certain cells of the current frontier.
+        Unchanged components are answered from the cache of the previous moves.
+        Returns:
+            tuple: (safe cells, mine cells) as sorted lists of flat indices
+        """
+        while True:
+            safe, mines = set(), set()
+            cache = {}
+            for rows in self._components():
+                key = tuple(sorted(rows))
+                result = self._cache.get(key)
+                if result is None:
+                    result = solve_constraints(rows)
+                cache[key] = result
+                safe |= result[0]
+                mines |= result[1]
+            self._cache = cache
+            new_mines = mines - self.mines
+            if not new_mines:
+                return sorted(safe), sorted(self.mines)
+            # new mines shrink the rows around them, which can force more cells
+            self.mines |= new_mines
+            self._rebuild(self.topology.gather(np.fromiter(new_mines, dtype=np.intp)))
+
+############################################################
+# Benchmark
+############################################################
+def benchmark(games=20, rows=16, cols=30, num_mines=99, seed=0, patterns=None):
+    """
+    Play the same boards with AIEngine._find_safe_move and with the frontier solver,
+    and print decision time per move and win rate.
+    Args:
+        games (int): Boards to play
+        rows, cols (int): Board shape
+        num_mines (int): Mines per board
+        seed (int): Random seed
+        patterns (PatternCache): Also play Expert with this pattern cache, None to skip
+    """
+    from constants import AIDifficulty
+    from ai import AIEngine
+    from board_functions import generate_boards, reveal
+
+    rng = np.random.default_rng(seed)
+    boards = generate_boards(games, rows, cols, num_mines, rng=rng)
+    engines = [("Medium", AIEngine(AIDifficulty.Medium)), ("Expert", AIEngine(AIDifficulty.Expert))]
+    if patterns is not None:
+        engines.append(("Expert+patterns", AIEngine(AIDifficulty.Expert, patterns=patterns)))
+    for name, engine in engines:
+        move_time, moves, wins = 0.0, 0, 0
+        for board in boards:
+            board = board.copy()
+            revealed = np.zeros(board.shape, dtype=bool)
+            # open on an empty cell so both engines start from the same position
+            start = np.argwhere(board == 0)
+            reveal(board, revealed, *start[0], sound=False)
+            while not np.all(revealed | (board == -1)):
+                begin = time.perf_counter()
+                x, y = engine.make_move(board, revealed)
+                move_time += time.perf_counter() - begin
+                moves += 1
+                if board[x, y] == -1:
+                    break
+                reveal(board, revealed, x, y, sound=False)
+            else:
+                wins += 1
+        print(f"{name:>15}: {move_time / moves * 1000:.2f} ms/move over {moves} moves, "
+              f"won {wins}/{games} on {cols}x{rows} with {num_mines} mines")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Frontier solver vs _find_safe_move benchmark")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=16)
+    parser.add_argument("--cols", type=int, default=30)
+    parser.add_argument("--mines", type=int, default=99)
+    args = parser.parse_args()
+    benchmark(args.games, args.rows, args.cols, args.mines)
@@ -0,0 +1,203 @@
+"""
+Minesweeper Tournament Spectator Module
+
+Module Name: spectator.py
+Description: One window showing a grid of small boards, each played by an AIEngine, to compare
+             AI difficulties live. All games live in one BatchMinesweeper and advance together
+             on a shared move scheduler. Each board is drawn as a thumbnail: its observation is
+             blitted one pixel per cell into an 8-bit palette surface with surfarray, then scaled
+             up. Only boards whose cells changed are redrawn and pushed to the display.
+
+Inputs:
+    - Command line: number of boards (16-64 works well), board settings, AI difficulties,
+      moves per second
+
+Outputs:
+    - Spectator window with per-difficulty win/loss counts
+    - With --frames: average frame rate after that many frames (use with SDL_VIDEODRIVER=dummy)
+
+External Sources:
+    - Pygame library
+    - Numpy
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import sys
+import math
+import time
+import argparse
+import numpy as np
+import pygame
+from constants import *
+from batch_env import BatchMinesweeper, FLAGGED
+from ai import AIEngine
+
+TILE_GAP = 8  # Pixels between thumbnails
+LABEL_HEIGHT = 18  # Room for the difficulty name under each thumbnail
+HEADER_HEIGHT = 40  # Win/loss summary strip
+
+# Thumbnail colour of each observation code, indexed by code - FLAGGED
+THUMB_PALETTE = [
+    FLAG_COLOR,       # FLAGGED
+    DARK_GRAY,        # HIDDEN
+    MINE_COLOR,       # revealed mine
+    REVEALED_COLOR,   # 0
+    (170, 190, 255),  # 1
+    (120, 200, 120),  # 2
+    (240, 140, 120),  # 3
+    (120, 120, 230),  # 4
+    (200, 90, 90),    # 5
+    (80, 190, 190),   # 6
+    (60, 60, 60),     # 7
+    (150, 150, 150),  # 8
+]
+
+############################################################
+# Spectator View Class
+############################################################
+class SpectatorView:
+    """
+    Grid of AI-played boards and their thumbnails.
+    Args:
+        count (int): Number of boards
+        rows, cols (int): Board shape
+        num_mines (int): Mines per board
+        difficulties (tuple): AIDifficulty levels, assigned to boards in turn
+        max_size (int): Largest window side in pixels
+        seed (int): Random seed, None for nondeterministic boards
+    """
+    def __init__(self, count=16, rows=GRID_SIZE, cols=GRID_SIZE, num_mines=10,
+                 difficulties=tuple(AIDifficulty), max_size=960, seed=None):
+        self.env = BatchMinesweeper(count, rows, cols, num_mines, seed=seed)
+        self.difficulties = [difficulties[i % len(difficulties)] for i in range(count)]
+        # Engines keep per-game state (Expert's solver rows), so each board gets its own
+        self.engines = [AIEngine(difficulty, self.env.topology) for difficulty in self.difficulties]
+        self.results = {difficulty: [0, 0] for difficulty in difficulties}  # wins, losses
+
+        # Layout: as square a grid as possible, whole pixels per cell
+        self.grid_cols = math.ceil(math.sqrt(count))
+        self.grid_rows = math.ceil(count / self.grid_cols)
+        self.cell_pixels = max(1, min((max_size - TILE_GAP) // self.grid_cols - TILE_GAP,
+                                      (max_size - HEADER_HEIGHT - TILE_GAP) // self.grid_rows - TILE_GAP - LABEL_HEIGHT)
+                               // max(rows, cols))
+        self.thumb_size = (cols * self.cell_pixels, rows * self.cell_pixels)
+        tile_w = self.thumb_size[0] + TILE_GAP
+        tile_h = self.thumb_size[1] + TILE_GAP + LABEL_HEIGHT
+        self.size = (TILE_GAP + self.grid_cols * tile_w, HEADER_HEIGHT + TILE_GAP + self.grid_rows * tile_h)
+        self.tiles = [pygame.Rect(TILE_GAP + (i % self.grid_cols) * tile_w,
+                                  HEADER_HEIGHT + TILE_GAP + (i // self.grid_cols) * tile_h, *self.thumb_size)
+                      for i in range(count)]
+
+        # One pixel per cell; the 8-bit palette turns observation codes into colours
+        self._cells = pygame.Surface((cols, rows), 0, 8)
+        self._cells.set_palette(THUMB_PALETTE)
+        self._thumb = pygame.Surface(self.thumb_size, 0, self._cells)
+        self._thumb.set_palette(THUMB_PALETTE)
+        self._last = None  # observations on screen, None to redraw everything
+        self._shown_results = None
+        self.font = None
+        self.moves = 0
+
+    def step(self):
+        """Advance every game by one AI move."""
+        _, _, _, info = self.env.step(self.env.ai_actions(self.engines))
+        for i in np.flatnonzero(info['won'] | info['lost']):
+            self.results[self.difficulties[i]][0 if info['won'][i] else 1] += 1
+        self.moves += 1
+
+    def draw(self, screen):
+        """
+        Redraw the thumbnails that changed since the last call.
+        Args:
+            screen: Pygame display surface
+        Returns:
+            list: Dirty rects to pass to pygame.display.update()
+        """
+        dirty = []
+        observations = self.env.observe()
+        full = self._last is None
+        if full:
+            self.font = self.font or pygame.font.Font(FONT_NAME, 20)
+            screen.fill(LIGHT_GRAY)
+            for tile, difficulty in zip(self.tiles, self.difficulties):
+                label = self.font.render(difficulty.name, True, TEXT_COLOR)
+                screen.blit(label, (tile.x, tile.bottom + 2))
+            dirty.append(screen.get_rect())
+            changed = np.arange(len(self.tiles))
+        else:
+            changed = np.flatnonzero(np.any(observations != self._last, axis=(1, 2)))
+        self._last = observations
+
+        for i in changed:
+            # surfarray is indexed (x, y) = (col, row), hence the transpose
+            pygame.surfarray.blit_array(self._cells, (observations[i] - FLAGGED).T)
+            pygame.transform.scale(self._cells, self.thumb_size, self._thumb)
+            screen.blit(self._thumb, self.tiles[i])
+            if not full:
+                dirty.append(self.tiles[i])
+
+        results = {difficulty: tuple(counts) for difficulty, counts in self.results.items()}
+        if results != self._shown_results:
+            self._shown_results = results
+            header = pygame.Rect(0, 0, self.size[0], HEADER_HEIGHT)
+            screen.fill(LIGHT_GRAY, header)
+            text = "   ".join(f"{difficulty.name} {wins}W/{losses}L" for difficulty, (wins, losses) in results.items())
+            screen.blit(self.font.render(text, True, TEXT_COLOR), (TILE_GAP, (HEADER_HEIGHT - self.font.get_linesize()) // 2))
+            dirty.append(header)
+        return dirty
+
+def main():
+    """
+    Entry point for the spectator window. Games advance on a shared scheduler at --rate moves per second.
+    """
+    parser = argparse.ArgumentParser(description="Watch many AI games side by side")
+    parser.add_argument("--boards", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=GRID_SIZE)
+    parser.add_argument("--cols", type=int, default=GRID_SIZE)
+    parser.add_argument("--mines", type=int, default=10)
+    parser.add_argument("--difficulties", nargs="+", choices=[d.name for d in AIDifficulty],
+                        default=[d.name for d in AIDifficulty])
+    parser.add_argument("--rate", type=float, default=4.0, help="moves per second for every board, 0 for one per frame")
+    parser.add_argument("--frames", type=int, help="quit after this many frames and print the frame rate")
+    args = parser.parse_args()
+
+    pygame.init()
+    view = SpectatorView(args.boards, args.rows, args.cols, args.mines,
+                         tuple(AIDifficulty[name] for name in args.difficulties))
+    screen = pygame.display.set_mode(view.size)
+    pygame.display.set_caption("Minesweeper AI tournament")
+    clock = pygame.time.Clock()
+
+    interval = 1.0 / args.rate if args.rate > 0 else 0.0
+    next_move = time.perf_counter()
+    frames = 0
+    start = time.perf_counter()
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+        now = time.perf_counter()
+        if now >= next_move:
+            view.step()
+            # if the AIs fall behind, skip ahead instead of bursting moves
+            next_move = max(next_move + interval, now)
+        dirty_rects = view.draw(screen)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        frames += 1
+        if args.frames and frames >= args.frames:
+            running = False
+        elif args.rate > 0:
+            clock.tick(FPS)
+
+    elapsed = time.perf_counter() - start
+    if args.frames:
+        print(f"{frames / elapsed:.1f} frames/s, {view.moves / elapsed:.1f} scheduler steps/s over {args.boards} boards; "
+              + ", ".join(f"{d.name} {w}W/{l}L" for d, (w, l) in view.results.items()))
+    pygame.quit()
+    sys.exit()
+
+if __name__ == "__main__":
+    main()
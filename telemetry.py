@@ -0,0 +1,218 @@
+"""
+Minesweeper Telemetry Module
+
+Module Name: telemetry.py
+Description: Structured event stream for analytics. emit() appends a timestamped record
+             (event, cell, value) to an in-memory ring buffer and returns at once; a
+             background thread flushes batches to rotating JSONL or packed binary files.
+             When the buffer is full new records are dropped and counted, so the frame
+             loop never waits on the disk.
+
+Inputs:
+    - Events from the game: start, restart, reveal, flag, chord, AI move (with decision
+      latency), win and loss
+    - Output directory and format, set once by configure()
+
+Outputs:
+    - telemetry-<host>-<pid>.jsonl (one JSON object per line) or .bin files (RECORD structs),
+      rotated to .1, .2, ... when they reach max_bytes
+    - read_records(path) -> generator of record dicts, for either format
+
+External Sources:
+    - threading, struct, json (Python standard library)
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import socket
+import struct
+import threading
+from collections import Counter, deque
+
+# Event codes; EVENTS[code] is the name written to JSONL
+EVENTS = ("start", "restart", "reveal", "flag", "chord", "ai_move", "win", "loss")
+START, RESTART, REVEAL, FLAG, CHORD, AI_MOVE, WIN, LOSS = range(len(EVENTS))
+
+# Binary record: timestamp (s), event code, x, y (-1 when not a cell event), value
+RECORD = struct.Struct("<dBhhf")
+
+############################################################
+# Emitter Class
+############################################################
+class TelemetryEmitter:
+    """
+    Ring buffer of event records flushed to disk on a background thread.
+    Args:
+        directory (str): Where the telemetry files are written
+        fmt (str): "jsonl" or "binary"
+        capacity (int): Records the buffer holds before new ones are dropped
+        interval (float): Seconds between flushes (sooner once `batch` records are waiting)
+        batch (int): Buffered records that wake the flush thread early
+        max_bytes (int): File size that triggers rotation
+        backups (int): Rotated files kept
+    """
+    def __init__(self, directory, fmt="jsonl", capacity=65536, interval=0.5, batch=4096,
+                 max_bytes=8 * 1024 * 1024, backups=5):
+        if fmt not in ("jsonl", "binary"):
+            raise ValueError(f"unknown telemetry format {fmt!r}")
+        os.makedirs(directory, exist_ok=True)
+        extension = "jsonl" if fmt == "jsonl" else "bin"
+        self.path = os.path.join(directory, f"telemetry-{socket.gethostname()}-{os.getpid()}.{extension}")
+        self.fmt = fmt
+        self.capacity = capacity
+        self.interval = interval
+        self.batch = max(1, min(batch, capacity // 2))  # wake before the buffer is full
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.dropped = 0
+        self.written = 0
+        self._buffer = deque()
+        self._wake = threading.Event()
+        self._closing = False
+        self._file = None
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def emit(self, event, x=-1, y=-1, value=0.0):
+        """
+        Record an event without blocking; drops it if the buffer is full.
+        Args:
+            event (int): Event code, e.g. REVEAL
+            x, y (int): Cell of the event, -1 if none
+            value (float): Event payload (cells opened, latency in ms, ...)
+        """
+        buffer = self._buffer
+        if len(buffer) >= self.capacity:
+            self.dropped += 1
+            return
+        buffer.append((time.time(), event, int(x), int(y), float(value)))
+        if len(buffer) >= self.batch:
+            self._wake.set()
+
+    def close(self):
+        """Flush what is buffered and stop the flush thread."""
+        self._closing = True
+        self._wake.set()
+        self._thread.join()
+
+    def _run(self):
+        """Flush loop of the background thread."""
+        while not self._closing:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self._flush()
+        self._flush()
+        if self._file is not None:
+            self._file.close()
+
+    def _flush(self):
+        """Write every buffered record, rotating the file when it is full."""
+        buffer = self._buffer
+        records = [buffer.popleft() for _ in range(len(buffer))]
+        if not records:
+            return
+        if self.fmt == "jsonl":
+            data = "".join(json.dumps({"ts": ts, "event": EVENTS[event], "x": x, "y": y, "value": value},
+                                      separators=(",", ":")) + "\n"
+                           for ts, event, x, y, value in records).encode()
+        else:
+            data = b"".join(RECORD.pack(*record) for record in records)
+        try:
+            if self._file is None:
+                self._file = open(self.path, "ab")
+            self._file.write(data)
+            self._file.flush()
+        except OSError:
+            # a full or missing disk loses this batch, never the game
+            self.dropped += len(records)
+            return
+        self.written += len(records)
+        if self._file.tell() >= self.max_bytes:
+            try:
+                self._rotate()
+            except OSError:
+                pass  # keep appending to the current file
+
+    def _rotate(self):
+        """Shift path -> path.1 -> path.2 ..., keeping `backups` old files."""
+        self._file.close()
+        self._file = None
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+############################################################
+# Process-wide Stream
+############################################################
+_emitter = None
+
+def configure(directory, fmt="jsonl", **options):
+    """
+    Start the process-wide telemetry stream; emit() is a no-op until this is called.
+    Args:
+        directory (str): Output directory
+        fmt (str): "jsonl" or "binary"
+        options: Other TelemetryEmitter arguments
+    Returns:
+        TelemetryEmitter: The running emitter
+    """
+    global _emitter
+    shutdown()
+    _emitter = TelemetryEmitter(directory, fmt, **options)
+    atexit.register(shutdown)  # flush on every exit path, including sys.exit() in menus
+    return _emitter
+
+def emit(event, x=-1, y=-1, value=0.0):
+    """Record an event on the process-wide stream, if one is configured."""
+    if _emitter is not None:
+        _emitter.emit(event, x, y, value)
+
+def shutdown():
+    """Flush and close the process-wide stream."""
+    global _emitter
+    if _emitter is not None:
+        emitter, _emitter = _emitter, None
+        emitter.close()
+
+############################################################
+# Reading
+############################################################
+def read_records(path):
+    """
+    Read a telemetry file written in either format.
+    Args:
+        path (str): .jsonl or .bin file (rotated copies included)
+    Yields:
+        dict: ts, event (name), x, y, value
+    """
+    with open(path, "rb") as file:
+        if ".jsonl" in os.path.basename(path):
+            for line in file:
+                yield json.loads(line)
+        else:
+            for ts, event, x, y, value in RECORD.iter_unpack(file.read()):
+                yield {"ts": ts, "event": EVENTS[event], "x": x, "y": y, "value": value}
+
+if __name__ == "__main__":
+    # Summary of telemetry files: event counts and AI decision latency
+    counts = Counter()
+    latencies = []
+    for path in sys.argv[1:]:
+        for record in read_records(path):
+            counts[record["event"]] += 1
+            if record["event"] == "ai_move":
+                latencies.append(record["value"])
+    for name in EVENTS:
+        print(f"{name:>8}: {counts[name]}")
+    if latencies:
+        latencies.sort()
+        print(f"AI move latency ms: median {latencies[len(latencies) // 2]:.2f}  max {latencies[-1]:.2f}")
@@ -0,0 +1,169 @@
+"""
+Minesweeper Board Topology Module
+
+Module Name: topology.py
+Description: Precomputes the neighbour index tables of a board shape once so board
+             generation, reveal and the AI can gather/scatter over neighbours with
+             array operations instead of nested bounds-checked loops.
+
+Inputs/Output:
+    - Many to different functions:
+        - get_topology(shape, wrap=False) -> Topology, cached per (shape, wrap)
+        - Topology.neighbors(x, y) -> np.ndarray, flat indices of one cell's neighbours
+        - Topology.gather(cells) -> np.ndarray, concatenated neighbour indices of many cells
+        - Topology.neighbor_sum(values) -> np.ndarray, per cell sum over its neighbours
+        - Topology.neighbor_max(values) -> np.ndarray, per cell max over its neighbours
+        - Topology.batch_any(mask) -> np.ndarray, per board and cell whether any neighbour is set
+
+External Sources:
+    - Numpy
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+from functools import lru_cache
+import numpy as np
+
+############################################################
+# Topology Class
+############################################################
+class Topology:
+    """
+    CSR-style neighbour table for a rows x cols board.
+    Cells are addressed by flat index (x * cols + y), matching board.reshape(-1).
+    The neighbours of cell i are indices[indptr[i]:indptr[i + 1]].
+    Args:
+        rows, cols (int): Board shape
+        wrap (bool): True for a torus (edges wrap around), False for a bounded board
+    """
+    def __init__(self, rows, cols, wrap=False):
+        self.rows = rows
+        self.cols = cols
+        self.wrap = wrap
+        self.size = rows * cols
+
+        xs, ys = np.divmod(np.arange(self.size), cols)
+        columns = []
+        valid = []
+        # One column per offset of the 3x3 window (minus the centre)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if dx == 0 and dy == 0:
+                    continue
+                nx, ny = xs + dx, ys + dy
+                if wrap:
+                    nx, ny = nx % rows, ny % cols
+                    ok = np.ones(self.size, dtype=bool)
+                else:
+                    ok = (nx >= 0) & (nx < rows) & (ny >= 0) & (ny < cols)
+                columns.append(np.where(ok, nx * cols + ny, self.size))
+                valid.append(ok)
+        table = np.stack(columns, axis=1)
+        mask = np.stack(valid, axis=1)
+        if wrap and (rows < 3 or cols < 3):
+            # Tiny tori alias the same neighbour through several offsets; keep it once
+            for i in range(self.size):
+                row = table[i]
+                first = np.array([row[k] not in row[:k] and row[k] != i for k in range(len(row))])
+                mask[i] &= first
+            table = np.where(mask, table, self.size)
+
+        # Padded (size, 8) table: missing neighbours point at the sentinel index `size`,
+        # so a value array padded with one extra element can be gathered without masking
+        self.table = table
+        self.degree = mask.sum(axis=1)
+        self.indptr = np.concatenate(([0], np.cumsum(self.degree)))
+        self.indices = table[mask]
+        # Owning cell of every entry in `indices`, used for scatter/reduce
+        self.owners = np.repeat(np.arange(self.size), self.degree)
+
+        for array in (self.table, self.degree, self.indptr, self.indices, self.owners):
+            array.setflags(write=False)
+
+    def neighbors(self, x, y):
+        """
+        Flat indices of the neighbours of cell (x, y).
+        Args:
+            x, y: Cell coordinates
+        Returns:
+            np.ndarray: Neighbour flat indices
+        """
+        i = x * self.cols + y
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def gather(self, cells):
+        """
+        Concatenated neighbour indices of several cells (duplicates kept).
+        Args:
+            cells: Flat cell indices
+        Returns:
+            np.ndarray: Neighbour flat indices of every cell in order
+        """
+        cells = np.asarray(cells, dtype=np.intp)
+        starts = self.indptr[cells]
+        counts = self.degree[cells]
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=self.indices.dtype)
+        # Offset of each output slot within the CSR `indices` array
+        shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return self.indices[shift + np.arange(total)]
+
+    def neighbor_sum(self, values):
+        """
+        Sum of `values` over each cell's neighbours.
+        Args:
+            values: Per-cell values, any shape with `size` elements
+        Returns:
+            np.ndarray: Flat per-cell sums
+        """
+        values = np.asarray(values).reshape(-1)
+        return np.bincount(self.owners, weights=values[self.indices], minlength=self.size)
+
+    def neighbor_max(self, values, initial=0):
+        """
+        Maximum of `values` over each cell's neighbours.
+        Args:
+            values: Per-cell values, any shape with `size` elements
+            initial: Floor of the result, returned for cells with no neighbours
+        Returns:
+            np.ndarray: Flat per-cell maxima
+        """
+        values = np.asarray(values).reshape(-1)
+        padded = np.append(values, initial)
+        return padded[self.table].max(axis=1, initial=initial)
+
+    def batch_any(self, mask):
+        """
+        For a batch of boards, whether any neighbour of each cell is True.
+        Args:
+            mask (np.ndarray): (count, size) bool array
+        Returns:
+            np.ndarray: (count, size) bool array
+        """
+        padded = np.zeros((mask.shape[0], self.size + 1), dtype=bool)
+        padded[:, :self.size] = mask
+        result = np.zeros(mask.shape, dtype=bool)
+        # One contiguous gather per neighbour slot beats a single (count, size, 8) gather
+        for k in range(self.table.shape[1]):
+            result |= padded[:, self.table[:, k]]
+        return result
+
+############################################################
+# Topology Cache
+############################################################
+@lru_cache(maxsize=None)
+def _build_topology(rows, cols, wrap):
+    return Topology(rows, cols, wrap)
+
+def get_topology(shape, wrap=False):
+    """
+    Return the (cached) topology for a board shape.
+    Args:
+        shape: (rows, cols) tuple, e.g. board.shape
+        wrap (bool): True for a torus board
+    Returns:
+        Topology: Shared neighbour tables for that shape
+    """
+    rows, cols = shape
+    return _build_topology(int(rows), int(cols), bool(wrap))
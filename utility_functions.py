@@ -11,6 +11,7 @@ Inputs/Output:
        - initialize_game(screen, clock, fonts) -> None, initializes buttons and checks for user to click buttons
        - load_sprites() -> sprites, returns dictionary of sprites
        - draw_labels(surface, fonts) -> None, Draw column letters (A-J) and row numbers (1-10) on the board
+       - StartupTimer(start, enabled) -> timer, records startup phases for --profile-startup
 
 External Sources: 
     - Pygame library
@@ -23,7 +24,10 @@ import pygame
 from constants import *
 from button import Button
 from slider import Slider
+from assets import AssetManager
+from widgets import WidgetManager, Label
 import sys
+import time
 
 ############################################################
 # Utility Functions
@@ -54,22 +58,27 @@ def initialize_game(screen, clock, fonts):
     difficulty = AIDifficulty.Easy
     mode = AIMode.Off
 
-    slider = Slider(WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT // 2 - 150, 300, 10, 20, 10, fonts['big'])
-    confirm_btn = Button((WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT // 2 - 100, 160, 50), "Confirm", fonts['big'])
+    # Widgets are rendered once and repainted only when their state changes
+    ui = WidgetManager(LIGHT_GRAY)
+    line_height = fonts['big'].get_linesize()
+    ui.add(Label((0, 120, WINDOW_WIDTH, line_height), "Choose Mine Count", fonts['big'], BLUE))
+    ai_diff = ui.add(Label((0, WINDOW_HEIGHT // 2 - 30, WINDOW_WIDTH, line_height), "", fonts['big'], BLUE))
+    ai_mode = ui.add(Label((0, WINDOW_HEIGHT // 2 + 70, WINDOW_WIDTH, line_height), "", fonts['big'], BLUE))
+
+    slider = ui.add(Slider(WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT // 2 - 150, 300, 10, 20, 10, fonts['big']))
+    confirm_btn = ui.add(Button((WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT // 2 - 100, 160, 50), "Confirm", fonts['big']))
     
-    ai_easy_btn = Button((WINDOW_WIDTH // 4 - 120, WINDOW_HEIGHT // 2, 160, 50), "Easy", fonts['big'])
-    ai_medium_btn = Button((WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT // 2, 160, 50), "Medium", fonts['big'])
-    ai_hard_btn = Button(((WINDOW_WIDTH * 3) // 4 - 40, WINDOW_HEIGHT // 2, 160, 50), "Hard", fonts['big'])
+    ai_easy_btn = ui.add(Button((WINDOW_WIDTH // 2 - 270, WINDOW_HEIGHT // 2, 120, 50), "Easy", fonts['big']))
+    ai_medium_btn = ui.add(Button((WINDOW_WIDTH // 2 - 130, WINDOW_HEIGHT // 2, 120, 50), "Medium", fonts['big']))
+    ai_hard_btn = ui.add(Button((WINDOW_WIDTH // 2 + 10, WINDOW_HEIGHT // 2, 120, 50), "Hard", fonts['big']))
+    ai_expert_btn = ui.add(Button((WINDOW_WIDTH // 2 + 150, WINDOW_HEIGHT // 2, 120, 50), "Expert", fonts['big']))
 
-    ai_off_btn = Button((WINDOW_WIDTH // 4 - 120, WINDOW_HEIGHT // 2 + 100, 160, 50), "Off", fonts['big'])
-    ai_alternate_btn = Button((WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT // 2 + 100, 160, 50), "Alternate", fonts['big'])
-    ai_solve_btn = Button(((WINDOW_WIDTH * 3) // 4 - 40, WINDOW_HEIGHT // 2 + 100, 160, 50), "Solve", fonts['big'])
+    ai_off_btn = ui.add(Button((WINDOW_WIDTH // 4 - 120, WINDOW_HEIGHT // 2 + 100, 160, 50), "Off", fonts['big']))
+    ai_alternate_btn = ui.add(Button((WINDOW_WIDTH // 2 - 80, WINDOW_HEIGHT // 2 + 100, 160, 50), "Alternate", fonts['big']))
+    ai_solve_btn = ui.add(Button(((WINDOW_WIDTH * 3) // 4 - 40, WINDOW_HEIGHT // 2 + 100, 160, 50), "Solve", fonts['big']))
+    ui.invalidate()
 
     while True:
-        screen.fill(LIGHT_GRAY)
-        title = fonts['big'].render("Choose Mine Count", True, BLUE)
-        screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 120))
-
         ai_diff_text = "Off"
         match (difficulty):
             case AIDifficulty.Easy:
@@ -78,6 +87,8 @@ def initialize_game(screen, clock, fonts):
                 ai_diff_text = "Medium"
             case AIDifficulty.Hard:
                 ai_diff_text = "Hard"
+            case AIDifficulty.Expert:
+                ai_diff_text = "Expert"
         ai_mode_text = "Alternate"
         match (mode):
             case AIMode.Off:
@@ -85,67 +96,46 @@ def initialize_game(screen, clock, fonts):
                 ai_mode_text = "Off"
             case AIMode.Solver:
                 ai_mode_text = "Solve"
-        ai_diff = fonts['big'].render("AI Difficulty: " + ai_diff_text, True, BLUE)
-        ai_mode = fonts['big'].render("AI Mode: " + ai_mode_text, True, BLUE)
-        screen.blit(ai_diff, (WINDOW_WIDTH // 2 - ai_diff.get_width() // 2, WINDOW_HEIGHT // 2 - 30))
-        screen.blit(ai_mode, (WINDOW_WIDTH // 2 - ai_mode.get_width() // 2, WINDOW_HEIGHT // 2 + 70))
-
-        slider.draw(screen)
-        confirm_btn.draw(screen)
-        ai_easy_btn.draw(screen)
-        ai_medium_btn.draw(screen)
-        ai_hard_btn.draw(screen)
-        ai_off_btn.draw(screen)
-        ai_alternate_btn.draw(screen)
-        ai_solve_btn.draw(screen)
+        ai_diff.set_text("AI Difficulty: " + ai_diff_text)
+        ai_mode.set_text("AI Mode: " + ai_mode_text)
+
+        dirty_rects = ui.draw(screen)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-            slider.handle_event(event)
-            if confirm_btn.is_clicked(event):
+            clicked = ui.handle_event(event)
+            if clicked is confirm_btn:
                 # Return the selected mine count when confirmed
                 return slider.value, difficulty, mode
-            if ai_easy_btn.is_clicked(event):
+            if clicked is ai_easy_btn:
                 difficulty = AIDifficulty.Easy
-            if ai_medium_btn.is_clicked(event):
+            if clicked is ai_medium_btn:
                 difficulty = AIDifficulty.Medium
-            if ai_hard_btn.is_clicked(event):
+            if clicked is ai_hard_btn:
                 difficulty = AIDifficulty.Hard
-            if ai_off_btn.is_clicked(event):
+            if clicked is ai_expert_btn:
+                difficulty = AIDifficulty.Expert
+            if clicked is ai_off_btn:
                 mode = AIMode.Off
-            if ai_alternate_btn.is_clicked(event):
+            if clicked is ai_alternate_btn:
                 mode = AIMode.Alternate                
-            if ai_solve_btn.is_clicked(event):
+            if clicked is ai_solve_btn:
                 mode = AIMode.Solver
 
-        pygame.display.flip()
         clock.tick(FPS)
 
 def load_sprites():
     """
-    Load all game sprite images from the sprites/ directory.
+    Load all game sprite images from the sprites/ directory, converted and pre-scaled.
+    Blocks until loading finishes; the game itself preloads through AssetManager instead.
     Returns:
         dict: Sprite surfaces keyed by name
     """
-    sprites = {}
-    sprites['you_lose'] = pygame.image.load("sprites/you_lose_normal.png")
-    sprites['you_win'] = pygame.image.load("sprites/you_win_normal.png")
-    sprites['clicked'] = pygame.image.load("sprites/clicked.png")
-    sprites['flag'] = pygame.image.load("sprites/flag.png")
-    sprites['basic'] = pygame.image.load("sprites/basic.png")
-    sprites['you_lose_human'] = pygame.image.load("sprites/you_human_lose.png")
-    sprites['you_win_human'] = pygame.image.load("sprites/you_human_win.png")
-    #sprites['you_lose_ai'] = pygame.image.load("sprites/you_ai_lose.png")
-    #sprites['you_win_ai'] = pygame.image.load("sprites/you_ai_win.png")
-    # Load numbered grid sprites
-    for i in range(1, 9):
-        sprites[f'grid{i}'] = pygame.image.load(f"sprites/grid_{i}.png")
-    sprites['mine'] = pygame.image.load("sprites/bomb.png")
-    sprites['mineClicked'] = pygame.image.load("sprites/bomb_clicked.png")
-    # Return all loaded sprites as a dictionary
-    return sprites
+    return AssetManager().load().sprites
 
 
 def draw_labels(surface, fonts):
@@ -162,4 +152,39 @@ def draw_labels(surface, fonts):
     for i in range(GRID_SIZE):
         text = fonts['small'].render(str(i+1), True, BLACK)
         # Draw row number label to the left of each row
-        surface.blit(text, (MARGIN_LEFT - 25, MARGIN_TOP + i * CELL_SIZE + CELL_SIZE // 2 - text.get_height() // 2))
\ No newline at end of file
+        surface.blit(text, (MARGIN_LEFT - 25, MARGIN_TOP + i * CELL_SIZE + CELL_SIZE // 2 - text.get_height() // 2))
+
+############################################################
+# Startup Profiling
+############################################################
+class StartupTimer:
+    """
+    Records how long each startup phase takes, for --profile-startup.
+    Args:
+        start (float): time.perf_counter() value the first phase is measured from
+        enabled (bool): Print the phases when report() is called
+    """
+    def __init__(self, start, enabled=False):
+        self.enabled = enabled
+        self.phases = []
+        self._start = start
+        self._last = start
+
+    def mark(self, phase):
+        """End a phase that started at the previous mark."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def skip(self):
+        """Leave out the time since the previous mark (e.g. waiting for the user in a menu)."""
+        self._start += time.perf_counter() - self._last
+        self._last = time.perf_counter()
+
+    def report(self, title):
+        """Print the phases recorded since the last report, if enabled."""
+        if self.enabled:
+            print(f"{title}: {(self._last - self._start) * 1000:.1f} ms")
+            for phase, seconds in self.phases:
+                print(f"  {phase:<20}{seconds * 1000:8.1f} ms")
+        self.phases = []
@@ -0,0 +1,185 @@
+"""
+Minesweeper Widget Manager Module
+
+Module Name: widgets.py
+Description: Retained-mode layer for menu screens. Tracks hover and dirty state of
+             Buttons, Sliders and Labels from input events, hit-tests clicks through a
+             bucketed spatial index, and repaints only the widgets whose state changed.
+
+Inputs:
+    - Widgets (Button, Slider, Label) added to the manager
+    - Pygame events
+
+Outputs:
+    - Label class for text that changes occasionally
+    - WidgetManager class returning the clicked button and the screen areas it repainted
+
+External Sources:
+    - Pygame library for rendering and handling user events
+
+Author: Team 8 & Team 17
+Creation Date: 10/19/2025
+"""
+import pygame
+from constants import *
+from button import Button
+from slider import Slider
+
+BUCKET_SIZE = 64  # Pixel size of one spatial index bucket
+
+############################################################
+# Label Class
+############################################################
+class Label:
+    """
+    Line of text centered horizontally in a fixed area; re-rendered only when the text changes.
+    Args:
+        rect (tuple): Area the text is centered in (x, y, w, h)
+        text (str): Initial text
+        font (pygame.font.Font): Font object
+        color: Text color
+    """
+    def __init__(self, rect, text, font, color=BLACK):
+        self.rect = pygame.Rect(rect)
+        self.font = font
+        self.color = color
+        self.text = None
+        self.dirty = False
+        self.set_text(text)
+
+    @property
+    def bounds(self):
+        """Screen area the label paints."""
+        return self.rect
+
+    def set_text(self, text):
+        """Change the text; marks the label dirty only if it differs."""
+        if text != self.text:
+            self.text = text
+            self._surface = self.font.render(text, True, self.color)
+            self.dirty = True
+
+    def draw(self, surface):
+        """Draw the pre-rendered text."""
+        surface.blit(self._surface, self._surface.get_rect(midtop=self.rect.midtop))
+
+############################################################
+# Widget Manager Class
+############################################################
+class WidgetManager:
+    """
+    Owns the widgets of one screen and repaints them on demand.
+    Args:
+        background: Color painted behind widgets before they are redrawn
+    """
+    def __init__(self, background=LIGHT_GRAY):
+        self.background = background
+        self.widgets = []
+        self.sliders = []
+        self.hovered = None
+        self._buckets = {}
+        self._dirty = []
+        self._full_redraw = True
+
+    def add(self, widget):
+        """
+        Register a widget and index its area.
+        Returns:
+            The widget, so it can be created and added in one line
+        """
+        self.widgets.append(widget)
+        if isinstance(widget, Slider):
+            self.sliders.append(widget)
+        bounds = widget.bounds
+        for bx in range(bounds.left // BUCKET_SIZE, (bounds.right - 1) // BUCKET_SIZE + 1):
+            for by in range(bounds.top // BUCKET_SIZE, (bounds.bottom - 1) // BUCKET_SIZE + 1):
+                self._buckets.setdefault((bx, by), []).append(widget)
+        self.mark_dirty(widget)
+        return widget
+
+    def mark_dirty(self, widget):
+        """Queue a widget for repaint."""
+        if widget not in self._dirty:
+            self._dirty.append(widget)
+
+    def invalidate(self):
+        """Repaint the whole screen on the next draw (e.g. after another screen used it)."""
+        self._full_redraw = True
+        self.set_hover(pygame.mouse.get_pos())
+
+    def widget_at(self, pos):
+        """
+        Button under a screen position, found through one bucket lookup.
+        Returns:
+            Button or None
+        """
+        for widget in self._buckets.get((pos[0] // BUCKET_SIZE, pos[1] // BUCKET_SIZE), ()):
+            if isinstance(widget, Button) and widget.rect.collidepoint(pos):
+                return widget
+        return None
+
+    def set_hover(self, pos):
+        """Update hover state for a mouse position, dirtying only buttons that changed."""
+        widget = self.widget_at(pos)
+        if widget is self.hovered:
+            return
+        for changed in (self.hovered, widget):
+            if changed is not None:
+                changed.hovered = changed is widget
+                self.mark_dirty(changed)
+        self.hovered = widget
+
+    def handle_event(self, event):
+        """
+        Update widget state from an event.
+        Args:
+            event: Pygame event
+        Returns:
+            Button: The button that was clicked, or None
+        """
+        for slider in self.sliders:
+            before = (slider.value, slider.knob_x)
+            slider.handle_event(event)
+            if (slider.value, slider.knob_x) != before:
+                self.mark_dirty(slider)
+        if event.type == pygame.MOUSEMOTION:
+            self.set_hover(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            widget = self.widget_at(event.pos)
+            if widget is not None:
+                widget.press()
+                return widget
+        return None
+
+    def draw(self, surface):
+        """
+        Repaint dirty widgets.
+        Args:
+            surface: Pygame surface
+        Returns:
+            list: Rects that changed, for pygame.display.update
+        """
+        for widget in self.widgets:
+            if getattr(widget, 'dirty', False):
+                self.mark_dirty(widget)
+        if self._full_redraw:
+            self._full_redraw = False
+            self._dirty = list(self.widgets)
+            surface.fill(self.background)
+            rects = [surface.get_rect()]
+        else:
+            rects = [widget.bounds for widget in self._dirty]
+            for rect in rects:
+                surface.fill(self.background, rect)
+            # Clean widgets overlapping a cleared area have to be painted again too
+            for widget in self.widgets:
+                if widget not in self._dirty and widget.bounds.collidelist(rects) != -1:
+                    self._dirty.append(widget)
+        for widget in self._dirty:
+            if isinstance(widget, Button):
+                widget.draw(surface, widget.hovered)
+            else:
+                widget.draw(surface)
+                widget.dirty = False
+        self._dirty = []
+        return rects